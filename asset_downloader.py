@@ -0,0 +1,203 @@
+"""
+Bloodborne Wiki Asset Downloader
+--------------------------------
+This script defines the AssetDownloader class, which keeps local copies of the
+images referenced by scraped records (weapon images, consumable icons and NPC
+portraits).
+
+Features:
+- Downloads many assets at once over a pooled requests.Session, so
+  connections to the same host are reused.
+- Content-addressed storage: each file is stored under the SHA-256 of its
+  bytes (assets/ab/ab12....png), so an image used by several records or
+  entity types is stored once.
+- Conditional requests: the ETag and Last-Modified of every URL are kept in a
+  manifest and sent back as If-None-Match / If-Modified-Since, so unchanged
+  assets are skipped with a 304 instead of downloaded again.
+- Sets an "image-path" field on records, pointing at the local copy.
+
+Storage layout (inside the asset directory):
+- manifest.json: URL -> {"etag", "last-modified", "sha256", "path"}.
+- ab/ab12....png: the asset files, sharded by the first two hash characters.
+
+Modules Used:
+- requests: For the pooled HTTP session.
+- concurrent.futures: For concurrent downloads.
+- hashlib: For content hashes.
+- json, os, threading, urllib.parse, mimetypes: For the manifest, paths and extensions.
+
+Usage:
+- downloader = AssetDownloader("assets")
+- downloader.attach("weapons", weapons)  # Downloads images and sets "image-path"
+
+Author: Austin Bennett
+Date: 2025-07-14
+"""
+
+import hashlib # For the content hash that names each stored file.
+import json # For the manifest.
+import mimetypes # Guesses a file extension from the Content-Type.
+import os # For file paths.
+import threading # Guards the manifest and counters across download threads.
+from concurrent.futures import ThreadPoolExecutor # Runs downloads concurrently.
+from urllib.parse import urljoin, urlparse # Resolves relative image URLs.
+
+import requests # A Python library for making HTTP requests to fetch web content.
+from requests.adapters import HTTPAdapter # Connection pool settings for the session.
+
+from scraper import BloodborneScraper # For the wiki base URL.
+
+class AssetDownloader:
+    def __init__(self, directory="assets", workers=8, base_url=None, timeout=30, session=None):
+        """
+        :param directory: The directory holding the manifest and the asset files.
+        :param workers: Concurrent downloads (and pooled connections per host).
+        :param base_url: URL that relative image URLs are resolved against
+                         (defaults to the wiki base URL).
+        :param timeout: Seconds before a single request is abandoned.
+        :param session: Optional requests.Session to use instead of a new pooled one.
+        """
+        self.directory = directory
+        self.workers = max(1, workers)
+        self.base_url = base_url or BloodborneScraper().base_url
+        self.timeout = timeout
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=self.workers, pool_maxsize=self.workers)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+        self.session = session
+        self.stats = {"downloaded": 0, "not-modified": 0, "deduplicated": 0, "failed": 0}
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+        self.manifest = self._read_manifest()
+
+    def _manifest_path(self):
+        return os.path.join(self.directory, "manifest.json")
+
+    def _read_manifest(self):
+        path = self._manifest_path()
+        if not os.path.exists(path):
+            return {}
+        with open(path, 'r', encoding='utf-8') as json_file:
+            return json.load(json_file)
+
+    def save_manifest(self):
+        # Write then rename, so a crash never leaves a half-written manifest
+        path = self._manifest_path()
+        with self._lock:
+            data = dict(self.manifest)
+        with open(path + ".tmp", 'w', encoding='utf-8') as json_file:
+            json.dump(data, json_file, indent=2, ensure_ascii=False)
+        os.replace(path + ".tmp", path)
+
+    def resolve(self, url):
+        """
+        Returns the absolute form of an image URL.
+        """
+        return urljoin(self.base_url, url)
+
+    def _extension(self, url, content_type):
+        ext = os.path.splitext(urlparse(url).path)[1].lower()
+        if not ext and content_type:
+            ext = mimetypes.guess_extension(content_type.split(";")[0].strip()) or ""
+        return ext
+
+    def _count(self, name):
+        with self._lock:
+            self.stats[name] += 1
+
+    def download(self, url):
+        """
+        Downloads one asset unless the stored copy is still current.
+
+        :param url: The asset URL (relative URLs are resolved against base_url).
+        :return: The local path of the asset, or None if it could not be fetched.
+        """
+        url = self.resolve(url)
+        with self._lock:
+            entry = self.manifest.get(url)
+        headers = {}
+        if entry and os.path.exists(os.path.join(self.directory, entry["path"])):
+            if entry.get("etag"):
+                headers["If-None-Match"] = entry["etag"]
+            if entry.get("last-modified"):
+                headers["If-Modified-Since"] = entry["last-modified"]
+        try:
+            response = self.session.get(url, headers=headers, timeout=self.timeout)
+            if response.status_code == 304 and headers:
+                self._count("not-modified")
+                return os.path.join(self.directory, entry["path"])
+            response.raise_for_status()
+        except requests.RequestException as e:
+            print(f"Failed to fetch asset {url}: {e}")
+            self._count("failed")
+            return None
+
+        content = response.content
+        digest = hashlib.sha256(content).hexdigest()
+        relative = os.path.join(digest[:2], digest + self._extension(url, response.headers.get("Content-Type")))
+        path = os.path.join(self.directory, relative)
+        if os.path.exists(path):
+            self._count("deduplicated")
+        else:
+            # Write then rename, so concurrent downloads of the same content never see a partial file
+            tmp = f"{path}.{threading.get_ident()}.tmp"
+            try:
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                with open(tmp, 'wb') as asset_file:
+                    asset_file.write(content)
+                os.replace(tmp, path)
+            except OSError as e:
+                # e.g. a full disk; fail this asset only, like a failed request
+                print(f"Failed to store asset {url}: {e}")
+                self._count("failed")
+                try:
+                    os.remove(tmp)
+                except OSError:
+                    pass
+                return None
+            self._count("downloaded")
+        with self._lock:
+            self.manifest[url] = {
+                "etag": response.headers.get("ETag"),
+                "last-modified": response.headers.get("Last-Modified"),
+                "sha256": digest,
+                "path": relative,
+            }
+        return path
+
+    def download_all(self, urls):
+        """
+        Downloads many assets concurrently; each distinct URL is fetched once.
+
+        :param urls: An iterable of asset URLs (None entries are ignored).
+        :return: A dictionary mapping each given URL to its local path (or None).
+        """
+        unique = list(dict.fromkeys(url for url in urls if url))
+        if not unique:
+            return {}
+        with ThreadPoolExecutor(max_workers=min(self.workers, len(unique))) as executor:
+            paths = dict(zip(unique, executor.map(self.download, unique)))
+        try:
+            self.save_manifest()
+        except OSError as e:
+            # Only costs conditional requests next run; the assets themselves are stored
+            print(f"Failed to save asset manifest: {e}")
+        return paths
+
+    def attach(self, entity, records):
+        """
+        Downloads the images of an entity type's records and sets each record's
+        "image-path" to the local copy (None if it has no image or the download failed).
+
+        :param entity: The entity type (used in the summary message).
+        :param records: A list of record dictionaries; updated in place.
+        :return: The same list of records.
+        """
+        paths = self.download_all(record.get("image") for record in records)
+        for record in records:
+            if "image" in record:
+                record["image-path"] = paths.get(record["image"])
+        print(f"Assets for {entity}: {len(paths)} image(s); totals so far {self.stats}")
+        return records
@@ -7,29 +7,57 @@ The CLI loads data from JSON files and allows for interactive exploration and ex
 
 Features:
 - List all entries with pagination for easy browsing.
+- Optionally reads from a SQLite database, pushing paging, filters and
+  statistics down to SQL queries.
 - Filter NPCs or other entities by keywords.
 - Display detailed information for selected entries.
+- Typo-tolerant fuzzy lookup of any entity by name.
+- Optional watch mode that reloads data files changed by a scraper run.
+- Group any field of any entity and count or aggregate each group.
+- Query language for Advanced Filter, e.g. boss where HP > 3000 order by HP desc limit 5.
+- Memoized results for filters, queries and statistics until the data changes.
+- Dataset history: browse snapshot versions, view data as of a version, diff versions.
 - Modular design for easy expansion.
 
 Modules Used:
 - models: Contains dataclasses for Bloodborne entities.
 - data_handler: Handles loading data from JSON files.
+- sqlite_store: Optional SQLite backend.
+- fuzzy_index: Trigram index for fuzzy name lookup.
+- dataset, file_watcher: Atomically reloadable data and file change detection.
+- group_by: Dictionary-encoded columns and cached group-by aggregates.
+- query_language: Compiled, index-planned queries for Advanced Filter.
+- result_cache: LRU cache of command results keyed by dataset version.
+- snapshot_store: Versioned snapshots of the data.
 
 Author: Austin Bennett
 Date: 2025-05-27
 """
 
-from models import Weapon, Armor, Boss, NPC, Item # Import data models
+from models import Weapon, Armor, Boss, NPC, Item, MODEL_CLASSES, KEY_FIELDS # Import data models
 from data_handler import DataHandler # Import data handling utilities
+from sqlite_store import SQLiteStore, EntityTable # Optional SQLite backend
+from fuzzy_index import FuzzyNameLookup # Typo-tolerant name lookup
+from dataset import Dataset # Holds the loaded data and swaps it atomically on reload
+from file_watcher import FileWatcher # Detects changed data files in watch mode
+from group_by import GroupByEngine, AGGREGATES # Cached group-by aggregates
+from query_language import QueryEngine, QueryError, compile_query # Query language for Advanced Filter
+from result_cache import ResultCache # Memoizes command results per dataset version
+from snapshot_store import SnapshotStore # Versioned history of the data
+import os # For mapping changed file paths back to entity types
 from collections import Counter # Import Counter for counting occurrences in data
 from colorama import Fore, Style, init # Import colorama for colored terminal output
 init(autoreset=True) # Initialize colorama to reset colors automatically
 
-def load_data():
+def load_data(db_path=None):
     """
     Loads all entity data from JSON files using the DataHandler.
     Returns lists of dictionaries for weapons, armor, bosses, items, and npcs.
+    If db_path is given, returns EntityTable views over that SQLite database instead.
     """
+    if db_path:
+        store = SQLiteStore(db_path)
+        return tuple(store.table(entity) for entity in ("weapons", "armor", "bosses", "items", "npcs"))
     data_handler = DataHandler()
     weapons = data_handler.load_from_json('weapons.json')
     armor = data_handler.load_from_json('armor.json')
@@ -56,9 +84,32 @@ def show_details(results, model_cls):
     except ValueError:
         print("Please enter a valid number.")
 
-def show_statistics(weapons, armor, bosses, items, npcs):
+def cached(cache, command, args, entities, compute, versions=None):
+    """
+    Returns compute() through the result cache if one is given, otherwise computes directly.
+    versions are the per-entity versions of the data compute() reads (see Dataset.state()).
+    """
+    if cache is None:
+        return compute()
+    return cache.get_or_compute(command, args, entities, compute, versions)
+
+def show_statistics(weapons, armor, bosses, items, npcs, engine=None, cache=None, versions=None):
     """
     Displays summary statistics for each entity type, with all text in red.
+    The damage-type count runs in SQL for a SQLite EntityTable; otherwise, if a
+    GroupByEngine is given, it comes from the engine's cache.
+    If a ResultCache is given, the summary is reused until the data changes;
+    versions are the dataset versions of the given records.
+    Returns the summary text.
+    """
+    stats_text = cached(cache, "show_statistics", (), list(MODEL_CLASSES),
+                        lambda: summary_statistics(weapons, armor, bosses, items, npcs, engine), versions)
+    print(Fore.RED + stats_text + Style.RESET_ALL)
+    return stats_text
+
+def summary_statistics(weapons, armor, bosses, items, npcs, engine=None):
+    """
+    Builds the summary statistics text shown by show_statistics().
     """
     stats_text = (
         f"\nBloodborne Data Summary Statistics\n"
@@ -66,19 +117,27 @@ def show_statistics(weapons, armor, bosses, items, npcs):
         f"Total Weapons: {len(weapons)}\n"
     )
     if weapons:
-        dmg_types = [w.get("damage_type", w.get("damage-type", "Unknown")) for w in weapons]
-        most_common = Counter(dmg_types).most_common(1)
+        if isinstance(weapons, EntityTable):
+            most_common = weapons.value_counts("damage-type")[:1]
+        elif engine:
+            most_common = engine.group_by("weapons", "damage-type")[:1]
+        else:
+            dmg_types = [w.get("damage_type", w.get("damage-type", "Unknown")) for w in weapons]
+            most_common = Counter(dmg_types).most_common(1)
         if most_common:
             stats_text += f"Most common weapon damage type: {most_common[0][0]} ({most_common[0][1]})\n"
     stats_text += f"Total Armor Sets: {len(armor)}\n"
     stats_text += f"Total Bosses: {len(bosses)}\n"
     if bosses:
-        max_hp = max(bosses, key=lambda b: int(b.get("HP", "0").replace(",", "") or 0))
+        if isinstance(bosses, EntityTable):
+            max_hp = bosses.max_by("HP") or {}
+        else:
+            max_hp = max(bosses, key=lambda b: int(b.get("HP", "0").replace(",", "") or 0))
         stats_text += f"Boss with highest HP: {max_hp.get('name', 'Unknown')} ({max_hp.get('HP', 'N/A')})\n"
     stats_text += f"Total Consumables: {len(items)}\n"
     stats_text += f"Total NPCs: {len(npcs)}\n"
     stats_text += f"{'='*30}\n"
-    print(Fore.RED + stats_text + Style.RESET_ALL)
+    return stats_text
 
 def export_results(results, filename, data_handler):
     """
@@ -88,6 +147,8 @@ def export_results(results, filename, data_handler):
     if not results:
         print("No data to export.")
         return
+    if not isinstance(results, list):
+        results = list(results) # e.g. a SQLite EntityTable
     fmt = input("Export as (json/csv)? ").strip().lower()
     if fmt == "json":
         data_handler.save_to_json(filename + ".json", results)
@@ -98,17 +159,52 @@ def export_results(results, filename, data_handler):
     else:
         print("Unknown format.")
 
-def advanced_filter(weapons, armor, bosses, items, npcs):
+def run_query(query_engine, text, cache=None, versions=None):
+    """
+    Runs a query-language string and displays the matching results.
+    versions must have been taken before the query runs (the engine reads the
+    current data), so a reload in between can only file a newer result under an
+    older version, which later lookups never ask for.
+    Returns (results, model class), or None if the query is invalid.
+    """
+    try:
+        entity = compile_query(text).entity
+        entity, results = cached(cache, "query", (text,), [entity], lambda: query_engine.run(text), versions)
+    except QueryError as e:
+        print(f"Query error: {e}")
+        return None
+    print(Fore.LIGHTBLACK_EX + f"Plan: {query_engine.explain(text)}" + Style.RESET_ALL)
+    name_key = KEY_FIELDS[entity]
+    if results:
+        print(f"\nFound {len(results)} result(s):")
+        for i, entry in enumerate(results):
+            print(f"{i+1}. {entry.get(name_key, 'No Name')}")
+        show_details(results, MODEL_CLASSES[entity])
+    else:
+        print("No results found.")
+    return results, MODEL_CLASSES[entity]
+
+def advanced_filter(weapons, armor, bosses, items, npcs, query_engine=None, cache=None, versions=None):
     """
     Allows the user to filter any entity type by a specific field and value.
     Prompts for entity type, field, and value, then displays matching results.
+    If a QueryEngine is given, a query such as
+    'boss where HP > 3000 and location ~ "Yharnam" order by HP desc limit 5'
+    can be entered instead.
+    versions are the dataset versions of the given records, used for caching.
+    Returns (results, model class) so the results can be exported.
     """
+    if query_engine:
+        text = input("Enter a query (or press Enter for a guided filter): ").strip()
+        if text:
+            return run_query(query_engine, text, cache, versions)
+
     entity_map = {
-        "weapon": (weapons, Weapon),
-        "armor": (armor, Armor),
-        "boss": (bosses, Boss),
-        "item": (items, Item),
-        "npc": (npcs, NPC)
+        "weapon": (weapons, Weapon, "weapons"),
+        "armor": (armor, Armor, "armor"),
+        "boss": (bosses, Boss, "bosses"),
+        "item": (items, Item, "items"),
+        "npc": (npcs, NPC, "npcs")
     }
     print("Entities: weapon, armor, boss, item, npc")
     entity = input("Which entity do you want to filter? ").strip().lower()
@@ -116,7 +212,7 @@ def advanced_filter(weapons, armor, bosses, items, npcs):
         print("Unknown entity.")
         return
 
-    data, model_cls = entity_map[entity]
+    data, model_cls, entity_key = entity_map[entity]
     if not data:
         print(f"No data loaded for {entity}s.")
         return
@@ -124,26 +220,40 @@ def advanced_filter(weapons, armor, bosses, items, npcs):
     print("Available fields:")
     for key in data[0].keys():
         print(f"- {key}")
-    field = input("Enter the field to filter by: ").strip()
+    field = input("Enter the field to filter by (* to search all text fields): ").strip()
     value = input("Enter the value to search for: ").strip().lower()
 
-    results = [d for d in data if field in d and value in str(d[field]).lower()]
+    def compute():
+        if field == "*":
+            # Full-text search: every word must appear in some field
+            if isinstance(data, EntityTable):
+                return data.search(value)
+            words = value.split()
+            return [d for d in data
+                    if all(any(word in str(v).lower() for v in d.values() if v) for word in words)]
+        if isinstance(data, EntityTable):
+            return data.filter_contains(field, value)
+        return [d for d in data if field in d and value in str(d[field]).lower()]
+
+    results = cached(cache, "advanced_filter", (entity_key, field, value), [entity_key], compute, versions)
     if results:
         print(f"\nFound {len(results)} result(s):")
         for i, entry in enumerate(results):
-            print(f"{i+1}. {entry.get('name', entry.get(field, 'No Name'))}")
+            print(f"{i+1}. {entry.get(KEY_FIELDS[entity_key], entry.get(field, 'No Name'))}")
         show_details(results, model_cls)
     else:
         print("No results found.")
+    return results, model_cls
 
 def list_all(data, model_cls, name_key="name", page_size=10):
     """
     Lists all entries in the data with pagination.
+    Returns (data, model class) so the listing can be exported.
     """
     total = len(data)
     if total == 0:
         print("No data available.")
-        return
+        return None
     page = 0
     while True:
         start = page * page_size
@@ -165,6 +275,7 @@ def list_all(data, model_cls, name_key="name", page_size=10):
             break
         else:
             print("Invalid command.")
+    return data, model_cls
 
 def show_help():
     """
@@ -182,24 +293,35 @@ def show_help():
         f"- NPCs: Non-player characters with roles in the world.\n"
         f"\nMenu Options:\n"
         f" - List All: Browse all entries with paging.\n"
-        f" - Advanced Filter: Filter by any field.\n"
+        f" - Advanced Filter: Filter by any field (* searches all text fields), or type a query such as\n"
+        f"   boss where HP > 3000 and location ~ \"Yharnam\" order by blood-echoes desc limit 5\n"
         f" - Export: Save your filtered results.\n"
         f" - Statistics: View summary stats for each entity type.\n"
+        f" - Fuzzy Lookup: Find any entry by name, even with typos.\n"
+        f" - Group By: Count or aggregate entries by any field.\n"
+        f" - Dataset History: View past snapshot versions and what changed.\n"
         f" - Help: Show this help screen.\n"
         f"\n{'='*20}"
     )
     print(Fore.LIGHTMAGENTA_EX + help_text + Style.RESET_ALL)
 
-def bosses_with_min_hp(bosses):
+def bosses_with_min_hp(bosses, cache=None, versions=None):
     """
     Lists all bosses with HP greater than a user-specified value.
+    versions are the dataset versions the bosses were taken from, used for caching.
+    Returns (bosses found, Boss) so the list can be exported.
     """
-    try:
-        min_hp = int(input("Show bosses with HP greater than: "))
-        filtered = [
+    def compute():
+        if isinstance(bosses, EntityTable):
+            return bosses.where_greater("HP", min_hp)
+        return [
             b for b in bosses
             if int(b.get("HP", "0").replace(",", "") or 0) > min_hp
         ]
+
+    try:
+        min_hp = int(input("Show bosses with HP greater than: "))
+        filtered = cached(cache, "bosses_with_min_hp", (min_hp,), ["bosses"], compute, versions)
         stats_text = (
             f"\nBosses with HP > {min_hp}\n"
             f"{'='*30}\n"
@@ -211,47 +333,222 @@ def bosses_with_min_hp(bosses):
             stats_text += "No bosses found with HP above that value.\n"
         stats_text += f"{'='*30}\n"
         print(Fore.BLUE + stats_text + Style.RESET_ALL)
+        return filtered, Boss
     except Exception as e:
         print(Fore.BLUE + f"Error: {e}" + Style.RESET_ALL)
+        return None
 
-def group_weapons_by_damage_type(weapons):
+def group_weapons_by_damage_type(weapons, engine=None):
     """
     Groups weapons by damage type and counts them.
+    The counts run in SQL for a SQLite EntityTable; otherwise, if a
+    GroupByEngine is given, they come from the engine's cache.
     """
-    from collections import Counter
-    dmg_types = [w.get("damage_type", w.get("damage-type", "Unknown")) for w in weapons]
-    counts = Counter(dmg_types)
+    if isinstance(weapons, EntityTable):
+        counts = weapons.value_counts("damage-type")
+    elif engine:
+        counts = engine.group_by("weapons", "damage-type")
+    else:
+        dmg_types = [w.get("damage_type", w.get("damage-type", "Unknown")) for w in weapons]
+        counts = Counter(dmg_types).items()
     stats_text = (
         f"\nWeapon Counts by Damage Type\n"
         f"{'='*30}\n"
     )
-    for dtype, count in counts.items():
+    for dtype, count in counts:
         stats_text += f"- {dtype}: {count}\n"
     stats_text += f"{'='*30}\n"
     print(Fore.GREEN + stats_text + Style.RESET_ALL)
 
-def main_menu():
+def group_by_field(dataset, engine):
+    """
+    Prompts for an entity type, a field to group by and an aggregate, then
+    displays one line per group.
+    """
+    print("Entities: " + ", ".join(MODEL_CLASSES))
+    entity = input("Which entity do you want to group? ").strip().lower()
+    if entity not in MODEL_CLASSES:
+        print("Unknown entity.")
+        return
+    data = dataset.get(entity)
+    if not data:
+        print(f"No data loaded for {entity}.")
+        return
+    print("Available fields:")
+    for key in data[0].keys():
+        print(f"- {key}")
+    field = input("Enter the field to group by: ").strip()
+    agg = input(f"Aggregate ({'/'.join(AGGREGATES)}, default count): ").strip().lower() or "count"
+    value_field = input("Enter the numeric field to aggregate: ").strip() if agg != "count" else None
+    try:
+        groups = engine.group_by(entity, field, agg, value_field)
+    except ValueError as e:
+        print(f"Error: {e}")
+        return
+    label = "Count" if agg == "count" else f"{agg} of {value_field}"
+    stats_text = (
+        f"\n{entity.title()} grouped by {field} ({label})\n"
+        f"{'='*30}\n"
+    )
+    for value, total in groups:
+        stats_text += f"- {value}: {round(total, 2) if isinstance(total, float) else total}\n"
+    stats_text += f"{'='*30}\n"
+    print(Fore.GREEN + stats_text + Style.RESET_ALL)
+
+def fuzzy_lookup(lookup):
+    """
+    Prompts for a (possibly misspelled) name and lists the closest matches
+    across all entity types, then shows details for a selected match.
+    """
+    query = input("Enter a name to look up: ").strip()
+    matches = lookup.search(query)
+    if not matches:
+        print("No results found.")
+        return
+    print(f"\nClosest matches for '{query}':")
+    for i, (score, entity, record) in enumerate(matches, start=1):
+        print(f"{i}. {record.get(KEY_FIELDS[entity], 'No Name')} [{entity}] ({score:.0%})")
+    try:
+        idx = int(input("Enter the number of the entry to view details: ")) - 1
+        if 0 <= idx < len(matches):
+            _, entity, record = matches[idx]
+            MODEL_CLASSES[entity].from_dict(record).display_info()
+        else:
+            print("Invalid selection.")
+    except ValueError:
+        print("Please enter a valid number.")
+
+def dataset_history(snapshot_dir="snapshots"):
+    """
+    Lists the stored snapshot versions and lets the user view an entity type
+    as of a version, or see what changed between two versions.
+    Returns (records, model class) when records were viewed.
+    """
+    store = SnapshotStore(snapshot_dir, read_only=True) # Browsing must not create the directory
+    versions = store.versions()
+    if not versions:
+        print(f"No snapshots found in {snapshot_dir}. Run main.py --snapshot to record one.")
+        return None
+    history_text = (
+        f"\nDataset History ({snapshot_dir})\n"
+        f"{'='*30}\n"
+    )
+    for entry in versions:
+        counts = ", ".join(f"{entity} {count}" for entity, count in entry["counts"].items())
+        note = f" - {entry['note']}" if entry.get("note") else ""
+        history_text += f"v{entry['version']} [{entry['kind']}] {entry['created']}{note}\n    {counts}\n"
+    history_text += f"{'='*30}\n"
+    print(Fore.CYAN + history_text + Style.RESET_ALL)
+
+    cmd = input("View as of a version (v), diff two versions (d), or back (q): ").strip().lower()
+    try:
+        if cmd == "v":
+            version = int(input("Version: "))
+            entity = input(f"Entity ({', '.join(MODEL_CLASSES)}): ").strip().lower()
+            if entity not in MODEL_CLASSES:
+                print("Unknown entity.")
+                return None
+            records = store.load(version, entity)
+            return list_all(records, MODEL_CLASSES[entity], KEY_FIELDS[entity])
+        if cmd == "d":
+            old_version = int(input("Older version: "))
+            new_version = int(input("Newer version: "))
+            changes = store.diff(old_version, new_version)
+            diff_text = (
+                f"\nChanges from v{old_version} to v{new_version}\n"
+                f"{'='*30}\n"
+            )
+            if not changes:
+                diff_text += "No changes.\n"
+            for entity, change in changes.items():
+                key = KEY_FIELDS[entity]
+                for record in change["added"]:
+                    diff_text += f"+ [{entity}] {record.get(key)}\n"
+                for record in change["removed"]:
+                    diff_text += f"- [{entity}] {record.get(key)}\n"
+                for old, new in change["changed"]:
+                    fields = ", ".join(f"{f}: {old.get(f)} -> {new.get(f)}" for f in new if old.get(f) != new.get(f))
+                    diff_text += f"~ [{entity}] {new.get(key)} ({fields})\n"
+            diff_text += f"{'='*30}\n"
+            print(Fore.CYAN + diff_text + Style.RESET_ALL)
+    except ValueError:
+        print("Please enter a valid number.")
+    except KeyError as e:
+        print(f"Error: {e}")
+    return None
+
+def reload_changed_file(dataset, path):
+    """
+    Watcher callback: reloads the entity type whose JSON file changed.
+    """
+    entity = os.path.splitext(os.path.basename(path))[0]
+    if entity in MODEL_CLASSES and dataset.reload(entity):
+        print(Fore.LIGHTBLACK_EX + f"\n[Reloaded {os.path.basename(path)}]" + Style.RESET_ALL)
+
+def main_menu(db_path=None, watch=False, as_of=None, snapshot_dir="snapshots"):
     """
     Main CLI loop. Presents the user with options to list, filter, display,
     and export data for all Bloodborne entities.
+
+    :param db_path: Optional SQLite database to read from instead of the JSON files.
+    :param watch: If True, reload JSON files that change while the CLI is running.
+    :param as_of: Optional snapshot version to explore instead of the current data;
+                  exits with an error if the version cannot be loaded.
+    :param snapshot_dir: The directory of the snapshot store.
     """
-    weapons, armor, bosses, items, npcs = load_data()
+    dataset = Dataset()
+    lookup = FuzzyNameLookup()
+    dataset.subscribe(lookup.rebuild) # Rebuild only the changed entity's name index
+    if as_of is not None:
+        snapshot = DataHandler().load_snapshot(snapshot_dir, as_of)
+        if snapshot is None:
+            raise SystemExit(f"Cannot explore snapshot version {as_of} of {snapshot_dir}.")
+        for entity in MODEL_CLASSES:
+            dataset.set(entity, snapshot.get(entity, []))
+    elif db_path:
+        for entity, table in zip(MODEL_CLASSES, load_data(db_path)):
+            dataset.set(entity, table)
+    else:
+        dataset.load_all()
+
+    engine = GroupByEngine(dataset) # Subscribes itself, so reloads drop its cached groups
+    query_engine = QueryEngine(dataset, engine) # Likewise drops its indexes on reload
+    # Keys include dataset versions, so reloads miss naturally. A SQLite database can
+    # change without a reload (and its versions never move), so --db runs uncached.
+    cache = None if db_path else ResultCache(dataset)
+
+    watcher = None
+    if watch and not db_path and as_of is None:
+        paths = [dataset.path(entity) for entity in MODEL_CLASSES]
+        watcher = FileWatcher(paths, lambda path: reload_changed_file(dataset, path)).start()
+        print(f"Watching data files for changes ({watcher.mode}).")
+
+    def with_state(command, *entities, **kwargs):
+        # Take one state so a reload mid-command cannot mix old and new data, and
+        # cached results are filed under the versions of the data they came from
+        state = dataset.state()
+        records = [state["records"][entity] for entity in entities or MODEL_CLASSES]
+        return command(*records, versions=state["versions"], **kwargs)
+
     data_handler = DataHandler()
     last_results = []
     last_model_cls = None
 
     menu_options = {
-        "1": lambda: list_all(weapons, Weapon, "name"),
-        "2": lambda: list_all(armor, Armor, "set"),
-        "3": lambda: list_all(bosses, Boss, "name"),
-        "4": lambda: list_all(items, Item, "name"),
-        "5": lambda: list_all(npcs, NPC, "name"),
+        "1": lambda: list_all(dataset.get("weapons"), Weapon, "name"),
+        "2": lambda: list_all(dataset.get("armor"), Armor, "set"),
+        "3": lambda: list_all(dataset.get("bosses"), Boss, "name"),
+        "4": lambda: list_all(dataset.get("items"), Item, "name"),
+        "5": lambda: list_all(dataset.get("npcs"), NPC, "name"),
         "6": lambda: export_results(last_results, "filtered_results", data_handler),
-        "7": lambda: advanced_filter(weapons, armor, bosses, items, npcs),
+        "7": lambda: with_state(advanced_filter, query_engine=query_engine, cache=cache),
         "8": show_help,
-        "9": lambda: show_statistics(weapons, armor, bosses, items, npcs),
-        "10": lambda: bosses_with_min_hp(bosses),
-        "11": lambda: group_weapons_by_damage_type(weapons),
+        "9": lambda: with_state(show_statistics, engine=engine, cache=cache),
+        "10": lambda: with_state(bosses_with_min_hp, "bosses", cache=cache),
+        "11": lambda: group_weapons_by_damage_type(dataset.get("weapons"), engine),
+        "12": lambda: fuzzy_lookup(lookup),
+        "13": lambda: group_by_field(dataset, engine),
+        "14": lambda: dataset_history(snapshot_dir),
     }
 
     while True:
@@ -268,7 +565,10 @@ def main_menu():
             f"9. Summary Statistics\n"
             f"10. List Bosses with HP > X\n"
             f"11. Group Weapons by Damage Type\n"
-            f"12. Exit\n"
+            f"12. Fuzzy Name Lookup\n"
+            f"13. Group By Any Field\n"
+            f"14. Dataset History\n"
+            f"15. Exit\n"
         )
         print(Fore.LIGHTMAGENTA_EX + menu_text + Style.RESET_ALL)
         choice = input("Choose an option: ")
@@ -276,13 +576,15 @@ def main_menu():
         if choice == "8":
             show_help()
         elif choice == "9":
-            show_statistics(weapons, armor, bosses, items, npcs)
-        elif choice == "12":
+            menu_options["9"]()
+        elif choice == "15":
+            if watcher:
+                watcher.stop()
             print("Goodbye!")
             break
         elif choice in menu_options:
             result = menu_options[choice]()
-            if choice in {"1", "2", "3", "4", "5", "7"} and result:
+            if choice in {"1", "2", "3", "4", "5", "7", "10", "14"} and result:
                 last_results, last_model_cls = result if isinstance(result, tuple) else ([], None)
         else:
             print("Invalid choice.")
@@ -0,0 +1,344 @@
+"""
+Bloodborne Wiki Column Store
+----------------------------
+This script defines a columnar binary file format for one entity type, and
+the ColumnarTable class that reads it through a memory map. Numeric fields
+(e.g. armor defenses, boss HP and blood echoes, weapon damage) are stored as
+fixed-width typed arrays, so they can be used without parsing JSON or CSV.
+
+File layout (little-endian):
+- Header: magic "BBCOLUMN", format version (uint16), column count (uint16),
+  descriptor length (uint32), row count (uint64).
+- Column descriptors: UTF-8 JSON list with each column's name, type and the
+  byte offsets of its arrays, relative to the data section.
+- Data section: starts at the first 64-byte boundary after the descriptors.
+- Numeric columns: one int32, int64 or float64 array each. Columns with
+  missing or non-integer values are float64, with NaN for missing values.
+- String columns: a uint64 offsets array (rows + 1), a UTF-8 blob and, if the
+  column has None values, a uint8 null mask.
+- Original text: if some values of a numeric field are not the plain number
+  (e.g. "2,031", "-" or "?"), a string column "<field>:text" keeps those
+  values (None for the rest), so records round-trip exactly.
+Every array starts on a 64-byte boundary.
+
+Features:
+- Loading memory-maps the file; numeric columns are zero-copy, read-only
+  NumPy views, and strings are decoded only when accessed.
+- Writes records (save_records) or ready-made columns (write_columns).
+- Generates synthetic datasets of any size for benchmarking analytics.
+
+Modules Used:
+- numpy: For the typed arrays and zero-copy views.
+- mmap: For memory-mapping the file.
+- struct, json: For the header and column descriptors.
+
+Usage:
+- save_records("bosses.bbcol", "bosses", bosses)
+- with ColumnarTable("bosses.bbcol") as table: table.column("HP").mean()
+- python column_store.py bosses 1000000 bosses.bbcol  # synthetic benchmark
+
+Author: Austin Bennett
+Date: 2025-07-21
+"""
+
+import argparse # For the synthetic benchmark's command-line options.
+import json # For the column descriptors.
+import mmap # Memory-maps the file when loading.
+import os # For file paths.
+import struct # For the fixed-size header.
+import time # For benchmark timing.
+
+import numpy as np # Typed arrays and zero-copy views over the memory map.
+
+from models import ENTITY_FIELDS, NUMERIC_FIELDS, KEY_FIELDS, parse_number # Field lists and number parsing.
+
+MAGIC = b"BBCOLUMN"
+FORMAT_VERSION = 1
+HEADER = struct.Struct("<8sHHIQ") # magic, version, column count, descriptor length, row count
+ALIGNMENT = 64
+TEXT_SUFFIX = ":text" # Name suffix of the original-text column of a numeric field
+
+def _padding(offset):
+    return -offset % ALIGNMENT
+
+def _data_start(descriptor_length):
+    end = HEADER.size + descriptor_length
+    return end + _padding(end)
+
+def format_number(value):
+    """
+    Formats a stored number the way it is written in the data files ("3015"),
+    or returns None for a missing value (None or NaN).
+    """
+    if value is None or value != value:
+        return None
+    return str(int(value)) if float(value).is_integer() else str(value)
+
+def numeric_array(values):
+    """
+    Converts parsed numbers (None for missing) to the narrowest fitting array:
+    int32 or int64 if every value is an integer, otherwise float64 with NaN.
+    """
+    if values and all(isinstance(v, int) for v in values):
+        array = np.array(values, dtype=np.int64)
+        info = np.iinfo(np.int32)
+        if info.min <= array.min() and array.max() <= info.max:
+            array = array.astype(np.int32)
+        return array
+    return np.array([np.nan if v is None else v for v in values], dtype=np.float64)
+
+def write_columns(filename, entity, numeric, strings):
+    """
+    Writes columns to a columnar file. All columns must have the same length.
+
+    :param filename: The path of the file to write.
+    :param entity: The entity type stored in the file.
+    :param numeric: A dictionary of field name -> NumPy array (int32, int64 or float64).
+    :param strings: A dictionary of field name -> list of strings (or None).
+    :return: The number of rows written.
+    """
+    lengths = {len(array) for array in numeric.values()} | {len(values) for values in strings.values()}
+    if len(lengths) > 1:
+        raise ValueError(f"Columns have different lengths: {sorted(lengths)}")
+    rows = lengths.pop() if lengths else 0
+
+    blocks = [] # (descriptor, offset key, bytes-like), in file order
+    descriptors = []
+    for name, array in numeric.items():
+        array = np.ascontiguousarray(array)
+        if array.dtype not in (np.int32, np.int64, np.float64):
+            raise ValueError(f"Unsupported dtype {array.dtype} for column {name!r}")
+        array = array.astype(array.dtype.newbyteorder("<"), copy=False)
+        descriptor = {"name": name, "type": "numeric", "dtype": array.dtype.str}
+        descriptors.append(descriptor)
+        blocks.append((descriptor, "offset", array))
+    for name, values in strings.items():
+        encoded = [b"" if value is None else str(value).encode("utf-8") for value in values]
+        offsets = np.zeros(rows + 1, dtype="<u8")
+        np.cumsum([len(value) for value in encoded], out=offsets[1:])
+        descriptor = {"name": name, "type": "string", "nbytes": int(offsets[-1]), "nulls": None}
+        descriptors.append(descriptor)
+        blocks.append((descriptor, "offsets", offsets))
+        blocks.append((descriptor, "data", b"".join(encoded)))
+        if any(value is None for value in values):
+            blocks.append((descriptor, "nulls", np.array([value is None for value in values], dtype=np.uint8)))
+
+    position = 0
+    for descriptor, key, data in blocks:
+        descriptor[key] = position
+        position += len(data) if isinstance(data, bytes) else data.nbytes
+        position += _padding(position)
+    body = json.dumps({"entity": entity, "columns": descriptors}).encode("utf-8")
+
+    # Write then rename, so readers never see a half-written file
+    with open(filename + ".tmp", 'wb') as column_file:
+        column_file.write(HEADER.pack(MAGIC, FORMAT_VERSION, len(descriptors), len(body), rows))
+        column_file.write(body)
+        column_file.write(b"\0" * (_data_start(len(body)) - HEADER.size - len(body)))
+        for _, _, data in blocks:
+            size = len(data) if isinstance(data, bytes) else data.nbytes
+            column_file.write(data if isinstance(data, bytes) else data.tobytes())
+            column_file.write(b"\0" * _padding(size))
+    os.replace(filename + ".tmp", filename)
+    return rows
+
+def save_records(filename, entity, records):
+    """
+    Writes records of one entity type to a columnar file. The entity's numeric
+    fields become typed arrays; its other fields become string columns. Values
+    of numeric fields that format_number() would not reproduce are kept in a
+    "<field>:text" column.
+
+    :return: The number of rows written.
+    """
+    numeric_fields = NUMERIC_FIELDS[entity]
+    numeric = {}
+    strings = {field: [record.get(field) for record in records]
+               for field in ENTITY_FIELDS[entity] if field not in numeric_fields}
+    for field in numeric_fields:
+        raw = [record.get(field) for record in records]
+        parsed = [parse_number(value) for value in raw]
+        numeric[field] = numeric_array(parsed)
+        texts = [None if format_number(number) == value else value for number, value in zip(parsed, raw)]
+        if any(text is not None for text in texts):
+            strings[field + TEXT_SUFFIX] = texts
+    return write_columns(filename, entity, numeric, strings)
+
+class StringColumn:
+    """
+    A read-only, list-like view of a string column; values are decoded on access.
+    """
+    def __init__(self, offsets, data, nulls):
+        self.offsets = offsets
+        self.data = data
+        self.nulls = nulls
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("string column index out of range")
+        if self.nulls is not None and self.nulls[index]:
+            return None
+        return str(self.data[int(self.offsets[index]):int(self.offsets[index + 1])], "utf-8")
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+class ColumnarTable:
+    def __init__(self, filename):
+        """
+        Memory-maps a columnar file and reads its header.
+
+        :param filename: The path of the columnar file.
+        :raises ValueError: if the file is not a supported columnar file.
+        """
+        self.filename = filename
+        with open(filename, 'rb') as column_file:
+            self._mmap = mmap.mmap(column_file.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            if len(self._mmap) < HEADER.size:
+                raise ValueError(f"{filename} is too short to be a columnar file")
+            magic, version, _, length, rows = HEADER.unpack_from(self._mmap)
+            if magic != MAGIC:
+                raise ValueError(f"{filename} is not a columnar file")
+            if version != FORMAT_VERSION:
+                raise ValueError(f"{filename} has unsupported format version {version}")
+            meta = json.loads(bytes(self._mmap[HEADER.size:HEADER.size + length]).decode("utf-8"))
+        except ValueError:
+            self._mmap.close()
+            raise
+        self.rows = rows
+        self.entity = meta["entity"]
+        self.descriptors = {column["name"]: column for column in meta["columns"]}
+        # Views of the data section, so descriptor offsets need no adjustment
+        self._buffer = memoryview(self._mmap)[_data_start(length):]
+
+    def __len__(self):
+        return self.rows
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    @property
+    def columns(self):
+        return [name for name in self.descriptors if not name.endswith(TEXT_SUFFIX)]
+
+    @property
+    def numeric_columns(self):
+        return [name for name, column in self.descriptors.items() if column["type"] == "numeric"]
+
+    def _descriptor(self, name, kind):
+        column = self.descriptors.get(name)
+        if column is None:
+            raise KeyError(f"Unknown column {name!r}; columns: {', '.join(self.descriptors)}")
+        if column["type"] != kind:
+            raise KeyError(f"Column {name!r} is a {column['type']} column")
+        return column
+
+    def column(self, name):
+        """
+        Returns a numeric column as a read-only NumPy view of the mapped file (no copy).
+        """
+        column = self._descriptor(name, "numeric")
+        return np.frombuffer(self._buffer, dtype=column["dtype"], count=self.rows, offset=column["offset"])
+
+    def strings(self, name):
+        """
+        Returns a string column as a StringColumn.
+        """
+        column = self._descriptor(name, "string")
+        offsets = np.frombuffer(self._buffer, dtype="<u8", count=self.rows + 1, offset=column["offsets"])
+        data = self._buffer[column["data"]:column["data"] + column["nbytes"]]
+        nulls = None
+        if column["nulls"] is not None:
+            nulls = np.frombuffer(self._buffer, dtype=np.uint8, count=self.rows, offset=column["nulls"])
+        return StringColumn(offsets, data, nulls)
+
+    def __getitem__(self, name):
+        if self.descriptors.get(name, {}).get("type") == "string":
+            return self.strings(name)
+        return self.column(name)
+
+    def to_records(self):
+        """
+        Materializes the table as record dictionaries, in the same form as the
+        JSON files: numeric fields get back their original text (e.g. "2,031"
+        or "-"). Fields that were missing from a record come back as None.
+        """
+        values = {}
+        for name in self.columns:
+            if self.descriptors[name]["type"] == "string":
+                values[name] = list(self.strings(name))
+                continue
+            values[name] = [format_number(v) for v in self.column(name).tolist()]
+            if name + TEXT_SUFFIX in self.descriptors:
+                texts = self.strings(name + TEXT_SUFFIX)
+                values[name] = [value if text is None else text for value, text in zip(values[name], texts)]
+        fields = [f for f in ENTITY_FIELDS.get(self.entity, []) if f in values] or list(values)
+        return [{field: values[field][i] for field in fields} for i in range(self.rows)]
+
+    def close(self):
+        """
+        Releases the memory map. If column views are still referenced, the map
+        stays open until they are garbage collected.
+        """
+        try:
+            self._buffer.release()
+            self._mmap.close()
+        except BufferError:
+            pass
+
+def synthetic_columns(entity, rows, seed=0):
+    """
+    Generates synthetic columns for an entity type: random numeric values in a
+    plausible range (about 2% missing) and unique key strings.
+
+    :return: (numeric, strings) dictionaries for write_columns().
+    """
+    rng = np.random.default_rng(seed)
+    numeric = {}
+    for field in NUMERIC_FIELDS[entity]:
+        values = rng.integers(0, 100000 if entity == "bosses" else 300, size=rows).astype(np.float64)
+        values[rng.random(rows) < 0.02] = np.nan
+        numeric[field] = values
+    key_field = KEY_FIELDS[entity]
+    strings = {key_field: [f"{entity} {i}" for i in range(rows)]}
+    return numeric, strings
+
+def main():
+    parser = argparse.ArgumentParser(description="Write and scan a synthetic columnar dataset.")
+    parser.add_argument("entity", choices=list(ENTITY_FIELDS), help="Entity type to generate.")
+    parser.add_argument("rows", type=int, help="Number of rows.")
+    parser.add_argument("filename", help="Columnar file to write.")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed.")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    numeric, strings = synthetic_columns(args.entity, args.rows, args.seed)
+    write_columns(args.filename, args.entity, numeric, strings)
+    print(f"Wrote {args.rows} rows to {args.filename} in {time.perf_counter() - start:.2f}s "
+          f"({os.path.getsize(args.filename) / 1e6:.1f} MB)")
+
+    start = time.perf_counter()
+    with ColumnarTable(args.filename) as table:
+        opened = time.perf_counter() - start
+        print(f"Opened in {opened * 1000:.2f} ms")
+        for name in table.numeric_columns:
+            start = time.perf_counter()
+            column = table.column(name)
+            mean, peak = np.nanmean(column), np.nanmax(column)
+            print(f"{name}: mean {mean:.1f}, max {peak:.0f} ({time.perf_counter() - start:.3f}s)")
+            del column
+
+if __name__ == "__main__":
+    main()
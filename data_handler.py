@@ -8,6 +8,10 @@ Features:
 - Saves structured data to JSON files with proper indentation.
 - Saves tabular data to CSV files with appropriate headers.
 - Loads data from both JSON and CSV files.
+- Optionally saves and loads data through a SQLite database (see sqlite_store.py).
+- Optionally keeps versioned snapshots of the data (see snapshot_store.py).
+- Exports and memory-maps a columnar binary format with typed numeric
+  columns (see column_store.py).
 - Implements exception handling to prevent data loss or corruption.
 
 Modules Used:
@@ -18,6 +22,9 @@ Modules Used:
 Usage:
 - Use `save_to_json()` and `save_to_csv()` to store scraped data.
 - Use `load_from_json()` and `load_from_csv()` to retrieve stored data.
+- Use `save_to_sqlite()` and `load_from_sqlite()` for the SQLite backend.
+- Use `save_snapshot()` and `load_snapshot()` to record and read past versions.
+- Use `save_to_columnar()` and `load_from_columnar()` for the columnar format.
 
 Author: Austin Bennett
 Date: 2025-03-13
@@ -26,6 +33,7 @@ Date: 2025-03-13
 import json # A module for working with JSON data, allowing you to save and load structured data.
 import csv # A module for reading and writing CSV (Comma-Separated Values) files.
 import os # Provides functions for interacting with the operating system, such as file handling.
+import sqlite3 # Built-in SQLite driver, used for the optional database backend.
 
 class DataHandler:
     def __init__(self): # Initialize any necessary attributes if needed
@@ -37,13 +45,20 @@ class DataHandler:
         
         :param filename: The name of the JSON file to save the data to.
         :param data: The data to save (should be serializable to JSON).
+        :return: True if the file was written, False otherwise.
         """
         try:
-            with open(filename, 'w', encoding='utf-8') as json_file:
+            # Write to a temporary file and rename it over the target, so a running
+            # session watching the file never reads it half-written.
+            temp_filename = filename + ".tmp"
+            with open(temp_filename, 'w', encoding='utf-8') as json_file:
                 json.dump(data, json_file, ensure_ascii=False, indent=4)
+            os.replace(temp_filename, filename)
             print(f"Data successfully saved to {filename}")
+            return True
         except IOError as e:
             print(f"Failed to save data to {filename}: {e}")
+            return False
 
     def save_to_csv(self, filename, data):
         """
@@ -51,10 +66,11 @@ class DataHandler:
         
         :param filename: The name of the CSV file to save the data to.
         :param data: The data to save (should be a list of dictionaries).
+        :return: True if the file was written, False otherwise.
         """
         if not data:
             print(f"No data to save to {filename}")
-            return
+            return False
 
         try:
             with open(filename, 'w', newline='', encoding='utf-8') as csv_file:
@@ -64,8 +80,10 @@ class DataHandler:
                 writer.writeheader()
                 writer.writerows(data)
             print(f"Data successfully saved to {filename}")
+            return True
         except IOError as e:
             print(f"Failed to save data to {filename}: {e}")
+            return False
 
     def load_from_json(self, filename):
         """
@@ -98,4 +116,124 @@ class DataHandler:
             return data
         except IOError as e:
             print(f"Failed to load data from {filename}: {e}")
-            return None
\ No newline at end of file
+            return None
+
+    def save_to_sqlite(self, filename, entity, data):
+        """
+        Bulk upserts records of one entity type into a SQLite database.
+
+        :param filename: The path of the SQLite database file.
+        :param entity: The entity type (e.g. "weapons", "bosses").
+        :param data: The data to save (should be a list of dictionaries).
+        :return: True if the records were written, False otherwise.
+        """
+        from sqlite_store import SQLiteStore # Imported here so the JSON/CSV paths don't need sqlite_store
+        if not data:
+            print(f"No data to save to {filename}")
+            return False
+        try:
+            with SQLiteStore(filename) as store:
+                count = store.upsert(entity, data)
+            print(f"Data successfully saved to {filename} ({count} {entity})")
+            return True
+        except sqlite3.Error as e:
+            print(f"Failed to save data to {filename}: {e}")
+            return False
+
+    def load_from_sqlite(self, filename, entity):
+        """
+        Loads all records of one entity type from a SQLite database.
+
+        :param filename: The path of the SQLite database file.
+        :param entity: The entity type (e.g. "weapons", "bosses").
+        :return: The loaded data as a list of dictionaries.
+        """
+        from sqlite_store import SQLiteStore
+        try:
+            with SQLiteStore(filename) as store:
+                data = store.load(entity)
+            print(f"Data successfully loaded from {filename} ({entity})")
+            return data
+        except sqlite3.Error as e:
+            print(f"Failed to load data from {filename}: {e}")
+            return None
+
+    def save_snapshot(self, directory, datasets, note=""):
+        """
+        Records the given data as a new version in a snapshot store.
+
+        :param directory: The snapshot directory.
+        :param datasets: A dictionary mapping entity types to lists of records.
+        :param note: An optional description of the version.
+        :return: The version number (unchanged if nothing differed), or None on failure.
+        """
+        from snapshot_store import SnapshotStore
+        try:
+            store = SnapshotStore(directory)
+            latest = store.latest_version()
+            version = store.commit(datasets, note)
+            if version == latest:
+                print(f"No changes since snapshot version {version}")
+            else:
+                print(f"Data successfully saved as snapshot version {version} in {directory}")
+            return version
+        except (IOError, ValueError) as e:
+            print(f"Failed to save snapshot to {directory}: {e}")
+            return None
+
+    def load_snapshot(self, directory, version, entity=None):
+        """
+        Loads the data as of a snapshot version.
+
+        :param directory: The snapshot directory.
+        :param version: The version number.
+        :param entity: If given, load only that entity type.
+        :return: A list of records (for one entity) or a dictionary of entity type -> records.
+        """
+        from snapshot_store import SnapshotStore
+        try:
+            data = SnapshotStore(directory, read_only=True).load(version, entity)
+            print(f"Data successfully loaded from {directory} (version {version})")
+            return data
+        except (IOError, ValueError, KeyError) as e:
+            print(f"Failed to load snapshot version {version} from {directory}: {e}")
+            return None
+
+    def save_to_columnar(self, filename, entity, data):
+        """
+        Saves records of one entity type to a columnar binary file, with its
+        numeric fields stored as typed arrays.
+
+        :param filename: The path of the columnar file.
+        :param entity: The entity type (e.g. "armor", "bosses").
+        :param data: The data to save (should be a list of dictionaries).
+        :return: True if the file was written, False otherwise.
+        """
+        from column_store import save_records # Imported here so the other formats don't need NumPy
+        if not data:
+            print(f"No data to save to {filename}")
+            return False
+        try:
+            count = save_records(filename, entity, data)
+            print(f"Data successfully saved to {filename} ({count} {entity})")
+            return True
+        except (IOError, ValueError) as e:
+            print(f"Failed to save data to {filename}: {e}")
+            return False
+
+    def load_from_columnar(self, filename):
+        """
+        Memory-maps a columnar binary file without parsing it.
+
+        :param filename: The path of the columnar file.
+        :return: A ColumnarTable whose column() returns zero-copy NumPy views
+                 (to_records() gives the records as dictionaries), or None on failure.
+        """
+        from column_store import ColumnarTable
+        try:
+            table = ColumnarTable(filename)
+            print(f"Data successfully loaded from {filename} ({len(table)} {table.entity})")
+            return table
+        except (IOError, ValueError) as e:
+            print(f"Failed to load data from {filename}: {e}")
+            return None
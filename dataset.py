@@ -0,0 +1,164 @@
+"""
+Bloodborne Wiki Dataset
+-----------------------
+This script defines the Dataset class, which holds the currently loaded records
+for every entity type in a long-running session and swaps them atomically when
+a data file is reloaded.
+
+Features:
+- Loads each entity type from its JSON file (weapons.json, bosses.json, ...).
+- Reloads a single entity type without touching the others.
+- Publishes each change as a new immutable snapshot, so readers holding the
+  previous snapshot never see half-loaded data.
+- Keeps a version number per entity and for the whole dataset. The
+  per-entity versions are published together with the records, so a reader
+  can tell exactly which version of the data it holds.
+- Notifies subscribers (indexes, caches) about exactly which entity changed.
+- Interns categorical field values before publishing, so equal values
+  (e.g. a damage type shared by many weapons) are stored once.
+- Rejects reloaded files that are not a list of records, and keeps one
+  failing subscriber from stopping the others.
+
+Modules Used:
+- threading: For serializing concurrent reloads.
+- sys: For interning repeated strings.
+- os: For building file paths.
+
+Usage:
+- dataset = Dataset(); dataset.load_all()
+- dataset.subscribe(lambda entity, records: ...)
+- dataset.reload("bosses")
+
+Author: Austin Bennett
+Date: 2025-06-12
+"""
+
+import os # Provides functions for interacting with the operating system, such as file handling.
+import sys # sys.intern for repeated categorical values.
+import threading # For serializing reloads coming from a watcher thread.
+from types import MappingProxyType # Read-only view used for published snapshots.
+
+from data_handler import DataHandler # Loads the JSON data files.
+from models import MODEL_CLASSES, CATEGORICAL_FIELDS # The known entity types and their categorical fields.
+
+def intern_categories(entity, records):
+    """
+    Replaces each string value of the entity's categorical fields with its
+    interned copy, so equal values share one string object.
+    """
+    fields = CATEGORICAL_FIELDS.get(entity, [])
+    for record in records:
+        for field in fields:
+            value = record.get(field)
+            if isinstance(value, str):
+                record[field] = sys.intern(value)
+
+class Dataset:
+    def __init__(self, directory="."):
+        """
+        :param directory: The directory containing the <entity>.json files.
+        """
+        self.directory = directory
+        self.data_handler = DataHandler()
+        # Records and per-entity versions are published as one read-only state
+        self._state = MappingProxyType({
+            "records": MappingProxyType({entity: [] for entity in MODEL_CLASSES}),
+            "versions": MappingProxyType({entity: 0 for entity in MODEL_CLASSES}),
+        })
+        self.version = 0
+        self._lock = threading.Lock()
+        self._listeners = []
+
+    def path(self, entity):
+        """
+        Returns the JSON file path for an entity type.
+        """
+        return os.path.join(self.directory, f"{entity}.json")
+
+    def get(self, entity):
+        """
+        Returns the current records of an entity type.
+        """
+        return self._state["records"][entity]
+
+    @property
+    def versions(self):
+        """
+        A read-only mapping of every entity type to its current version.
+        """
+        return self._state["versions"]
+
+    def snapshot(self):
+        """
+        Returns a read-only mapping of every entity type to its records.
+        Use this when one operation reads several entity types and needs them
+        to come from the same point in time.
+        """
+        return self._state["records"]
+
+    def state(self):
+        """
+        Returns a read-only mapping with the "records" snapshot and the
+        per-entity "versions" of exactly those records. Use this when results
+        computed from the records are cached by version.
+        """
+        return self._state
+
+    def subscribe(self, listener):
+        """
+        Registers listener(entity, records), called after an entity type changes.
+        """
+        self._listeners.append(listener)
+
+    def set(self, entity, records):
+        """
+        Replaces the records of one entity type and notifies subscribers.
+        The new snapshot is published with a single reference assignment.
+        Categorical values of a list of records are interned first; the values
+        stay equal, so callers still holding the records see no difference.
+        """
+        if isinstance(records, list):
+            intern_categories(entity, records)
+        with self._lock:
+            snapshot = dict(self._state["records"])
+            snapshot[entity] = records
+            versions = dict(self._state["versions"])
+            versions[entity] += 1
+            self.version += 1
+            self._state = MappingProxyType({
+                "records": MappingProxyType(snapshot),
+                "versions": MappingProxyType(versions),
+            })
+            for listener in self._listeners:
+                try:
+                    listener(entity, records)
+                except Exception as e:
+                    print(f"Failed to update {getattr(listener, '__qualname__', listener)} for {entity}: {e}")
+
+    def reload(self, entity):
+        """
+        Reloads one entity type from its JSON file. If the file is missing, only
+        partially written or not a list of records, the current records are kept.
+
+        :return: True if the records were replaced, False otherwise.
+        """
+        try:
+            records = self.data_handler.load_from_json(self.path(entity))
+        except ValueError as e: # json.JSONDecodeError, e.g. a file caught mid-write
+            print(f"Failed to load data from {self.path(entity)}: {e}")
+            records = None
+        if records is None:
+            return False
+        if not isinstance(records, list) or not all(isinstance(record, dict) for record in records):
+            print(f"Ignoring {self.path(entity)}: expected a list of records")
+            return False
+        self.set(entity, records)
+        return True
+
+    def load_all(self):
+        """
+        Loads every entity type from its JSON file.
+        """
+        for entity in MODEL_CLASSES:
+            self.reload(entity)
+        return self
@@ -0,0 +1,146 @@
+"""
+Bloodborne Wiki File Watcher
+----------------------------
+This script defines the FileWatcher class, which watches the data files of a
+running session and reports which of them changed, so only those entity types
+need to be reloaded.
+
+Features:
+- Uses Linux inotify (through ctypes, no extra packages) when available.
+- Falls back to polling file modification times everywhere else.
+- Runs in a daemon thread and calls back with the changed file path.
+- Watches the containing directory, so files replaced by rename are seen too.
+
+Modules Used:
+- ctypes: For calling inotify in the C library.
+- select, struct: For reading inotify events.
+- threading: For the background thread and polling interval.
+- os: For file metadata.
+
+Usage:
+- watcher = FileWatcher(["bosses.json"], on_change); watcher.start()
+- watcher.stop()
+
+Author: Austin Bennett
+Date: 2025-06-12
+"""
+
+import ctypes # For calling inotify from the C library.
+import ctypes.util # For locating the C library.
+import os # Provides functions for interacting with the operating system, such as file handling.
+import select # For waiting on the inotify file descriptor with a timeout.
+import struct # For decoding inotify event headers.
+import sys # For checking the platform.
+import threading # For running the watcher in the background.
+
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+EVENT_HEADER = struct.Struct("iIII") # wd, mask, cookie, name length
+
+def _load_inotify():
+    """
+    Returns the C library if it provides inotify, otherwise None.
+    """
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        libc.inotify_init1 # Raises AttributeError if missing
+        return libc
+    except (OSError, AttributeError):
+        return None
+
+class FileWatcher:
+    def __init__(self, paths, callback, interval=1.0, use_inotify=True):
+        """
+        :param paths: The files to watch.
+        :param callback: Called as callback(path) from the watcher thread after a file changes.
+        :param interval: Seconds between checks when polling (and the stop-check timeout for inotify).
+        :param use_inotify: Set to False to force mtime polling.
+        """
+        self.paths = [os.path.abspath(p) for p in paths]
+        self.callback = callback
+        self.interval = interval
+        self.libc = _load_inotify() if use_inotify else None
+        self.mode = "inotify" if self.libc else "polling"
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        """
+        Starts watching in a background daemon thread.
+        """
+        target = self._watch_inotify if self.libc else self._watch_polling
+        self._thread = threading.Thread(target=target, name="FileWatcher", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """
+        Stops watching and waits for the thread to finish.
+        """
+        self._stop.set()
+        if self._thread:
+            self._thread.join()
+
+    def _stat(self, path):
+        try:
+            info = os.stat(path)
+            return info.st_mtime_ns, info.st_size
+        except OSError:
+            return None
+
+    def _notify(self, path):
+        # A failing callback must not end the watcher thread, or later changes are missed
+        try:
+            self.callback(path)
+        except Exception as e:
+            print(f"Failed to handle change to {path}: {e}")
+
+    def _watch_polling(self):
+        seen = {path: self._stat(path) for path in self.paths}
+        while not self._stop.wait(self.interval):
+            for path in self.paths:
+                current = self._stat(path)
+                if current is not None and current != seen[path]:
+                    seen[path] = current
+                    self._notify(path)
+
+    def _watch_inotify(self):
+        fd = self.libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if fd < 0:
+            self.mode = "polling"
+            return self._watch_polling()
+        try:
+            watched = {}
+            for directory in {os.path.dirname(p) for p in self.paths}:
+                wd = self.libc.inotify_add_watch(fd, directory.encode(), IN_CLOSE_WRITE | IN_MOVED_TO)
+                if wd >= 0:
+                    watched[wd] = directory
+            targets = set(self.paths)
+            while not self._stop.is_set():
+                ready, _, _ = select.select([fd], [], [], self.interval)
+                if not ready:
+                    continue
+                changed = []
+                for wd, mask, name in self._read_events(fd):
+                    path = os.path.join(watched.get(wd, ""), name)
+                    if path in targets and path not in changed:
+                        changed.append(path)
+                for path in changed:
+                    self._notify(path)
+        finally:
+            os.close(fd)
+
+    def _read_events(self, fd):
+        try:
+            buffer = os.read(fd, 64 * 1024)
+        except BlockingIOError:
+            return
+        offset = 0
+        while offset + EVENT_HEADER.size <= len(buffer):
+            wd, mask, _, length = EVENT_HEADER.unpack_from(buffer, offset)
+            offset += EVENT_HEADER.size
+            name = buffer[offset:offset + length].rstrip(b"\0").decode(errors="replace")
+            offset += length
+            yield wd, mask, name
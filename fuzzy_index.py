@@ -0,0 +1,134 @@
+"""
+Bloodborne Wiki Fuzzy Name Index
+--------------------------------
+This script defines a typo-tolerant name lookup over all Bloodborne entities.
+Names are broken into character trigrams and stored in an inverted index, so a
+query only touches the records that share at least one trigram with it instead
+of computing an edit distance against every record.
+
+Features:
+- NGramIndex: an inverted trigram index over one list of names.
+- FuzzyNameLookup: one NGramIndex per entity type, searched together and
+  rebuilt per entity when that entity's data changes.
+- Ranked results scored by how much of the query each name covers.
+
+Modules Used:
+- collections: For counting shared trigrams.
+- re: For normalizing names into words.
+
+Usage:
+- lookup = FuzzyNameLookup({"bosses": bosses, "npcs": npcs})
+- lookup.search("adela nun")  ->  [(score, "npcs", record), ...]
+
+Author: Austin Bennett
+Date: 2025-06-09
+"""
+
+import re # For splitting names into lowercase words.
+from collections import Counter, defaultdict # For counting shared trigrams per candidate.
+
+from models import KEY_FIELDS # The name field of each entity type.
+
+WORD_RE = re.compile(r"[a-z0-9']+")
+
+def ngrams(text, n=3):
+    """
+    Returns the set of character n-grams of text. Each word is padded with
+    spaces so that word starts and ends form their own n-grams.
+    """
+    grams = set()
+    for word in WORD_RE.findall(text.lower()):
+        padded = f" {word} "
+        if len(padded) < n:
+            grams.add(padded)
+            continue
+        for i in range(len(padded) - n + 1):
+            grams.add(padded[i:i + n])
+    return grams
+
+class NGramIndex:
+    def __init__(self, n=3):
+        """
+        :param n: The n-gram length (3 works well for short names).
+        """
+        self.n = n
+        self.postings = defaultdict(list) # n-gram -> ids of the names containing it
+        self.gram_counts = [] # id -> number of distinct n-grams in the name
+        self.items = [] # id -> (name, payload)
+
+    def __len__(self):
+        return len(self.items)
+
+    def add(self, name, payload=None):
+        """
+        Adds a name to the index.
+
+        :param name: The text to index.
+        :param payload: Any object returned alongside the name in search results.
+        """
+        item_id = len(self.items)
+        grams = ngrams(name, self.n)
+        for gram in grams:
+            self.postings[gram].append(item_id)
+        self.gram_counts.append(len(grams))
+        self.items.append((name, payload))
+
+    def search(self, query, limit=10, min_score=0.4):
+        """
+        Finds the names most similar to query.
+
+        The score is the share of the query's n-grams found in the name, so a
+        partial or misspelled name still ranks the right record first. Ties are
+        broken by the Dice coefficient, which favours names close in length.
+
+        :return: A list of (score, name, payload) tuples, best first.
+        """
+        query_grams = ngrams(query, self.n)
+        if not query_grams:
+            return []
+        shared = Counter()
+        for gram in query_grams:
+            shared.update(self.postings.get(gram, ()))
+        total = len(query_grams)
+        scored = []
+        for item_id, count in shared.items():
+            score = count / total
+            if score < min_score:
+                continue
+            dice = 2 * count / (total + self.gram_counts[item_id])
+            scored.append((score, dice, item_id))
+        scored.sort(key=lambda s: (-s[0], -s[1], s[2]))
+        return [(score, *self.items[item_id]) for score, _, item_id in scored[:limit]]
+
+class FuzzyNameLookup:
+    def __init__(self, datasets=None):
+        """
+        :param datasets: Optional dictionary mapping entity types to their records.
+        """
+        self.indexes = {}
+        for entity, records in (datasets or {}).items():
+            self.rebuild(entity, records)
+
+    def rebuild(self, entity, records):
+        """
+        Rebuilds the index for a single entity type, leaving the others untouched.
+        The new index is built first and swapped in with one assignment.
+        """
+        name_key = KEY_FIELDS.get(entity, "name")
+        index = NGramIndex()
+        for record in records or []:
+            index.add(record.get(name_key) or "", record)
+        self.indexes[entity] = index
+
+    def search(self, query, limit=10, min_score=0.4):
+        """
+        Searches every entity type and merges the results.
+
+        :return: A list of (score, entity, record) tuples, best first.
+        """
+        results = []
+        for entity, index in list(self.indexes.items()):
+            for score, name, record in index.search(query, limit, min_score):
+                results.append((score, entity, name, record))
+        results.sort(key=lambda r: (-r[0], len(r[2])))
+        return [(score, entity, record) for score, entity, _, record in results[:limit]]
@@ -0,0 +1,213 @@
+"""
+Bloodborne Wiki Group-By Engine
+-------------------------------
+This script defines dictionary-encoded categorical columns and a cached
+group-by/aggregate engine over the loaded Bloodborne entities.
+
+Features:
+- CategoricalColumn: stores a field as small integer codes plus a lookup table
+  of distinct values, so grouping becomes integer counting.
+- Multi-valued fields (e.g. NPC timezones "Day, Evening, Night") are split
+  into one code per value.
+- Dataset interns categorical values before publishing records, so equal
+  values share one string object, and each column's lookup table reuses those
+  objects instead of copying them. The engine never modifies the records.
+- GroupByEngine: group any field of any entity type, counting rows or
+  aggregating a numeric field (sum, mean, min, max).
+- Columns and aggregates are cached per entity type and dropped when that
+  entity type is reloaded. Each cached entry remembers the records it was
+  built from, so a result computed during a reload is never served afterwards.
+- SQLite-backed entity types (EntityTable) are encoded only when first used,
+  and plain counts of single-valued fields run as SQL GROUP BY queries.
+
+Modules Used:
+- array: For compact integer code arrays.
+- collections: For counting codes.
+- threading: Guards the caches against a file-watcher thread.
+
+Usage:
+- engine = GroupByEngine(dataset)
+- engine.group_by("weapons", "damage-type")
+- engine.group_by("bosses", "location", agg="max", value_field="HP")
+
+Author: Austin Bennett
+Date: 2025-06-16
+"""
+
+from array import array # Compact typed arrays for category codes.
+from collections import Counter # For counting codes.
+import threading # Serializes cache updates with reloads from a watcher thread.
+
+from models import ENTITY_FIELDS, CATEGORICAL_FIELDS, MULTI_VALUED_FIELDS, parse_number # Entity metadata.
+
+AGGREGATES = ("count", "sum", "mean", "min", "max")
+
+class CategoricalColumn:
+    def __init__(self, values, separator=None):
+        """
+        Dictionary-encodes a sequence of field values.
+
+        :param values: One value per row.
+        :param separator: If given, each value is split on it and stripped, and
+                          every part gets its own code (multi-valued field).
+        """
+        self.separator = separator
+        self.categories = [] # code -> value
+        self.lookup = {} # value -> code
+        self.codes = array("I")
+        # Row i owns codes[offsets[i]:offsets[i + 1]]; only used for multi-valued fields
+        self.offsets = array("I", [0]) if separator else None
+        for value in values:
+            if separator is None:
+                self.codes.append(self.encode(value))
+            else:
+                parts = [part.strip() for part in str(value).split(separator)] if value else []
+                self.codes.extend(self.encode(part) for part in parts if part)
+                self.offsets.append(len(self.codes))
+
+    def __len__(self):
+        return len(self.offsets) - 1 if self.separator else len(self.codes)
+
+    def encode(self, value):
+        """
+        Returns the code for value, adding it to the lookup table if new.
+        """
+        code = self.lookup.get(value)
+        if code is None:
+            code = len(self.categories)
+            self.lookup[value] = code
+            self.categories.append(value)
+        return code
+
+    def row_codes(self, row):
+        """
+        Returns the codes of one row (a single code unless multi-valued).
+        """
+        if self.separator is None:
+            return (self.codes[row],)
+        return self.codes[self.offsets[row]:self.offsets[row + 1]]
+
+    def value(self, row):
+        """
+        Returns the canonical (interned) value of one row of a single-valued column.
+        """
+        return self.categories[self.codes[row]]
+
+class GroupByEngine:
+    def __init__(self, dataset):
+        """
+        :param dataset: The Dataset to group over. The engine subscribes to it
+                        and drops cached results for any entity type that changes.
+        """
+        self.dataset = dataset
+        # Both caches map to (source records, value); an entry is only used while
+        # its source is still the dataset's current records for that entity type.
+        self._columns = {} # (entity, field) -> (records, CategoricalColumn)
+        self._results = {} # (entity, field, agg, value_field) -> (records, list of (value, aggregate))
+        self._lock = threading.RLock()
+        dataset.subscribe(self.invalidate)
+        for entity in CATEGORICAL_FIELDS:
+            records = dataset.get(entity)
+            if isinstance(records, list): # SQLite tables are encoded lazily by column()
+                self.encode_entity(entity, records)
+
+    def invalidate(self, entity, records=None):
+        """
+        Drops the cached columns and aggregates of one entity type. When the new
+        records are given as a list, the entity's categorical fields are re-encoded.
+        """
+        with self._lock:
+            self._columns = {k: v for k, v in self._columns.items() if k[0] != entity}
+            self._results = {k: v for k, v in self._results.items() if k[0] != entity}
+            if isinstance(records, list):
+                self.encode_entity(entity, records)
+
+    def encode_entity(self, entity, records):
+        """
+        Encodes the known categorical fields of an entity type.
+        """
+        for field in CATEGORICAL_FIELDS.get(entity, []):
+            self.column(entity, field, records)
+
+    def column(self, entity, field, records=None):
+        """
+        Returns the dictionary-encoded column for any field, building it on first use.
+
+        :param records: The records to encode (defaults to the dataset's current records).
+        """
+        if records is None:
+            records = self.dataset.get(entity)
+        with self._lock:
+            cached = self._columns.get((entity, field))
+            if cached is not None and cached[0] is records:
+                return cached[1]
+            separator = "," if field in MULTI_VALUED_FIELDS.get(entity, []) else None
+            column = CategoricalColumn((record.get(field, "Unknown") for record in records), separator)
+            self._columns[(entity, field)] = (records, column)
+            return column
+
+    def group_by(self, entity, field, agg="count", value_field=None):
+        """
+        Groups an entity type by a field and aggregates each group.
+
+        :param entity: The entity type (e.g. "weapons").
+        :param field: The field to group by. Multi-valued fields count once per value.
+        :param agg: One of "count", "sum", "mean", "min" or "max".
+        :param value_field: The numeric field to aggregate (required unless agg is "count").
+        :return: A list of (value, aggregate) tuples, largest aggregate first;
+                 ties keep the order in which values first appear.
+        """
+        if agg not in AGGREGATES:
+            raise ValueError(f"Unknown aggregate {agg!r}; expected one of {', '.join(AGGREGATES)}")
+        if agg != "count" and not value_field:
+            raise ValueError(f"Aggregate {agg!r} needs a value field")
+        key = (entity, field, agg, value_field if agg != "count" else None)
+        with self._lock:
+            # Read the records once, so the column and the values come from the same data
+            records = self.dataset.get(entity)
+            cached = self._results.get(key)
+            if cached is not None and cached[0] is records:
+                return cached[1]
+            result = self._group(entity, field, agg, value_field, records)
+            self._results[key] = (records, result)
+            return result
+
+    def _group(self, entity, field, agg, value_field, records):
+        if (agg == "count" and not isinstance(records, list) and hasattr(records, "value_counts")
+                and field in ENTITY_FIELDS[entity] and field not in MULTI_VALUED_FIELDS.get(entity, [])):
+            # A SQLite EntityTable counts in SQL, without loading the table
+            return [("Unknown" if value is None else value, count) for value, count in records.value_counts(field)]
+
+        column = self.column(entity, field, records)
+        if agg == "count":
+            totals = Counter(column.codes)
+        else:
+            if not isinstance(records, list):
+                records = list(records) # e.g. a SQLite EntityTable; avoid one query per row
+            groups = {}
+            for row in range(len(column)):
+                number = parse_number(records[row].get(value_field))
+                if number is None:
+                    continue
+                for code in column.row_codes(row):
+                    groups.setdefault(code, []).append(number)
+            totals = {code: _aggregate(agg, numbers) for code, numbers in groups.items()}
+
+        return sorted(((column.categories[code], total) for code, total in totals.items()),
+                      key=lambda pair: (-pair[1], column.lookup[pair[0]]))
+
+    def most_common(self, entity, field):
+        """
+        Returns the (value, count) pair of the most common value, or None.
+        """
+        counts = self.group_by(entity, field)
+        return counts[0] if counts else None
+
+def _aggregate(agg, numbers):
+    if agg == "sum":
+        return sum(numbers)
+    if agg == "mean":
+        return sum(numbers) / len(numbers)
+    if agg == "min":
+        return min(numbers)
+    return max(numbers)
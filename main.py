@@ -9,6 +9,12 @@ Features:
 - Initializes the scraper and data handler modules.
 - Scrapes various types of data from the Bloodborne Wiki.
 - Saves extracted data in both JSON and CSV formats.
+- Optionally imports the data into a SQLite database and runs the CLI against it.
+- Optionally watches the JSON files and reloads them while the CLI is running.
+- Optionally records the JSON files as a versioned snapshot, or explores a past version.
+- Scrapes all entity types through a staged pipeline (fetch, parse, validate, write)
+  whose stages overlap, and reports which stage limits throughput.
+- Optionally downloads record images while scraping, into content-addressed storage.
 - Implements exception handling to manage potential errors.
 
 Modules Used:
@@ -17,10 +23,12 @@ Modules Used:
 - json: For saving structured data in JSON format.
 - csv: For storing data in CSV format.
 - os: For file operations.
+- argparse: For command-line options.
 
 Custom Modules:
 - scraper: Contains the BloodborneScraper class responsible for fetching data.
 - data_handler: Handles saving and organizing the scraped data.
+- pipeline: Runs the scrape-to-storage stages concurrently.
 
 Author: Austin Bennett
 Date: 2025-03-13
@@ -31,12 +39,15 @@ from bs4 import BeautifulSoup # Part of the bs4 library, used for parsing HTML a
 import json # A module for working with JSON data, allowing you to save and load structured data.
 import csv # A module for reading and writing CSV (Comma-Separated Values) files.
 import os # Provides functions for interacting with the operating system, such as file handling.
+import argparse # For parsing command-line options.
 
 # Import your custom modules
 from scraper import BloodborneScraper # Custom module for scraping data from the Bloodborne Wiki.
 from data_handler import DataHandler  # Custom module for saving the scraped data into JSON and CSV formats.
 from models import Weapon, Armor, Boss, NPC, Item # Custom data models for representing different entities in the game.
 from cli import main_menu # CLI interface for interacting with the scraped data.
+from sqlite_store import SQLiteStore # Optional SQLite storage backend.
+from pipeline import ScrapePipeline, PipelineError, format_report # Staged scrape-to-storage pipeline.
 
 def main():
     """
@@ -44,8 +55,50 @@ def main():
         This function serves as the entry point for the application, 
         delegating all user interaction and data exploration to the CLI defined in cli.py.
     """
+    parser = argparse.ArgumentParser(description="Bloodborne Wiki data CLI.")
+    parser.add_argument("--db", help="Use this SQLite database instead of the JSON files.")
+    parser.add_argument("--import-db", action="store_true", help="Bulk import the JSON/CSV files into --db first.")
+    parser.add_argument("--watch", action="store_true", help="Reload JSON files that change while the CLI is running.")
+    parser.add_argument("--snapshot", action="store_true", help="Record the current JSON files as a new snapshot version first.")
+    parser.add_argument("--as-of", type=int, metavar="VERSION", help="Explore the data as of a snapshot version.")
+    parser.add_argument("--snapshot-dir", default="snapshots", help="Directory of the snapshot store.")
+    parser.add_argument("--scrape", action="store_true", help="Scrape the wiki through the staged pipeline and save the results, then exit.")
+    parser.add_argument("--fetch-workers", type=int, default=5, help="Concurrent page downloads when scraping.")
+    parser.add_argument("--parse-workers", type=int, help="Parse processes when scraping (default: CPU count).")
+    parser.add_argument("--retries", type=int, default=2, help="Extra fetch attempts per page when scraping.")
+    parser.add_argument("--on-error", choices=["skip", "fail"], default="skip", help="Skip failed pages or stop the scrape.")
+    parser.add_argument("--assets", action="store_true", help="Download record images when scraping.")
+    parser.add_argument("--asset-dir", default="assets", help="Directory of the downloaded images.")
+    parser.add_argument("--asset-workers", type=int, default=8, help="Concurrent image downloads when scraping.")
+    args = parser.parse_args()
+
+    if args.import_db:
+        if not args.db:
+            parser.error("--import-db requires --db")
+        with SQLiteStore(args.db) as store:
+            counts = store.import_files()
+        print(f"Imported into {args.db}: {counts}")
+
+    if args.scrape:
+        pipeline = ScrapePipeline(
+            fetch_workers=args.fetch_workers, parse_workers=args.parse_workers,
+            retries=args.retries, on_error=args.on_error, db_path=args.db,
+            snapshot_dir=args.snapshot_dir if args.snapshot else None,
+            asset_dir=args.asset_dir if args.assets else None, asset_workers=args.asset_workers,
+        )
+        try:
+            print(format_report(pipeline.run()))
+        except PipelineError as e:
+            print(f"Scrape stopped: {e}")
+        return
+
+    if args.snapshot:
+        data_handler = DataHandler()
+        datasets = {entity: data_handler.load_from_json(f"{entity}.json") for entity in ("weapons", "armor", "bosses", "items", "npcs")}
+        data_handler.save_snapshot(args.snapshot_dir, {e: records for e, records in datasets.items() if records is not None})
+
     # Start the CLI (which can also call save_all_data after any user-driven change)
-    main_menu()
+    main_menu(args.db, watch=args.watch, as_of=args.as_of, snapshot_dir=args.snapshot_dir)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
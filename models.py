@@ -208,4 +208,76 @@ class Item:
             num_held=data.get("num-held", ""),
             stored=data.get("stored", ""),
             usage_type=data.get("usage-type", "")
-        )
\ No newline at end of file
+        )
+
+# Entity metadata shared by the storage, query and CLI modules.
+# Keys match the file names (weapons.json, armor.json, ...).
+MODEL_CLASSES = {
+    "weapons": Weapon,
+    "armor": Armor,
+    "bosses": Boss,
+    "items": Item,
+    "npcs": NPC,
+}
+
+# The field that identifies a record within its entity type.
+KEY_FIELDS = {
+    "weapons": "name",
+    "armor": "set",
+    "bosses": "name",
+    "items": "name",
+    "npcs": "name",
+}
+
+# The record fields for each entity type, in scraper output order.
+ENTITY_FIELDS = {
+    "weapons": ["name", "link", "base-damage", "damage-type", "durability", "stats-needed", "stat-bonuses", "special attack",
+                "image", "image-path"],
+    "armor": ["set", "link", "physical-defense", "blunt-defense", "thrust-defense", "blood-defense", "arcane-defense",
+              "fire-defense", "bolt-defense", "slow-poison-resist", "rapid-poison-resist", "frenzy-resist", "beasthood"],
+    "bosses": ["name", "link", "drops", "HP", "blood-echoes", "location", "required"],
+    "items": ["name", "link", "effect", "num-held", "stored", "usage-type", "image", "image-path"],
+    "npcs": ["name", "link", "item", "drop", "location", "timezones", "image", "image-path"],
+}
+
+# Entity types whose records carry an "image" URL and, once downloaded, an "image-path".
+IMAGE_ENTITIES = ["weapons", "items", "npcs"]
+
+# Fields that hold numbers stored as strings (e.g. "3015" or "2,031").
+NUMERIC_FIELDS = {
+    "weapons": ["base-damage", "durability"],
+    "armor": ENTITY_FIELDS["armor"][2:],
+    "bosses": ["HP", "blood-echoes"],
+    "items": [],
+    "npcs": [],
+}
+
+def parse_number(value):
+    """
+    Converts a scraped numeric string such as "3015" or "2,031" to a number.
+    Returns None for empty or non-numeric values such as "-" or "?".
+    """
+    if value is None:
+        return None
+    text = str(value).replace(",", "").strip()
+    try:
+        return int(text)
+    except ValueError:
+        try:
+            return float(text)
+        except ValueError:
+            return None
+
+# Highly repetitive fields that are dictionary-encoded for grouping.
+CATEGORICAL_FIELDS = {
+    "weapons": ["damage-type"],
+    "armor": [],
+    "bosses": ["location", "required"],
+    "items": ["usage-type"],
+    "npcs": ["timezones"],
+}
+
+# Categorical fields holding comma-separated lists (e.g. "Day, Evening, Night").
+MULTI_VALUED_FIELDS = {
+    "npcs": ["timezones"],
+}
@@ -0,0 +1,162 @@
+"""
+Bloodborne Wiki Parallel Parser
+-------------------------------
+This script parses fetched Bloodborne Wiki pages in a pool of worker processes.
+BeautifulSoup parsing and cell extraction are CPU-bound and hold the GIL, so
+threads cannot speed them up; worker processes can. Only the raw HTML is sent
+to each worker and only the compact record dictionaries are sent back.
+
+Features:
+- Parses (entity, html) pages across a configurable number of processes.
+- Configurable chunking to amortize inter-process overhead on many small pages.
+- Saves and loads an HTML corpus so parsing can be benchmarked offline.
+- Benchmarks parse throughput across worker counts on a saved corpus.
+
+Modules Used:
+- concurrent.futures: For the process pool.
+- argparse: For the benchmark command line.
+- os, time: For corpus files and timing.
+
+Usage:
+- ParallelParser(workers=4).parse(scraper.fetch_corpus())
+- python parallel_parser.py --save-corpus corpus
+- python parallel_parser.py corpus --workers 1 2 4 8 --replicate 50
+
+Author: Austin Bennett
+Date: 2025-06-02
+"""
+
+import argparse # For parsing the benchmark command-line arguments.
+import os # Provides functions for interacting with the operating system, such as file handling.
+import time # For timing benchmark runs.
+from concurrent.futures import ProcessPoolExecutor # Runs parsing in separate processes.
+
+from scraper import BloodborneScraper, parse_html # Custom scraper and its picklable parse function.
+
+def _parse_page(page):
+    """
+    Worker entry point: parses one (entity, html) page.
+    Returns the entity together with its records so results can be merged.
+    """
+    entity, html = page
+    return entity, parse_html(entity, html)
+
+class ParallelParser:
+    def __init__(self, workers=None, chunksize=1):
+        """
+        :param workers: Number of worker processes (defaults to the CPU count).
+                        A value of 1 parses in the current process.
+        :param chunksize: Number of pages handed to a worker per task.
+        """
+        self.workers = workers or os.cpu_count() or 1
+        self.chunksize = max(1, chunksize)
+
+    def parse(self, pages):
+        """
+        Parses the given pages and merges the records per entity type.
+
+        :param pages: An iterable of (entity, html) tuples.
+        :return: A dictionary mapping each entity type to its list of records,
+                 in the same order as the pages were given.
+        """
+        results = {}
+        for entity, records in self.iter_parse(pages):
+            results.setdefault(entity, []).extend(records)
+        return results
+
+    def iter_parse(self, pages):
+        """
+        Parses the given pages, yielding (entity, records) per page in order.
+
+        :param pages: An iterable of (entity, html) tuples.
+        """
+        if self.workers == 1:
+            for page in pages:
+                yield _parse_page(page)
+            return
+        with ProcessPoolExecutor(max_workers=self.workers) as pool:
+            yield from pool.map(_parse_page, pages, chunksize=self.chunksize)
+
+def save_corpus(pages, directory):
+    """
+    Saves fetched pages to a directory, one HTML file per page.
+
+    :param pages: An iterable of (entity, html) tuples.
+    :param directory: The directory to write the files to.
+    """
+    os.makedirs(directory, exist_ok=True)
+    count = 0
+    for count, (entity, html) in enumerate(pages, start=1):
+        path = os.path.join(directory, f"{entity}__{count:05d}.html")
+        with open(path, 'w', encoding='utf-8') as html_file:
+            html_file.write(html)
+    print(f"Saved {count} page(s) to {directory}")
+
+def load_corpus(directory):
+    """
+    Loads a corpus saved with save_corpus().
+
+    :param directory: The directory containing the HTML files.
+    :return: A list of (entity, html) tuples in file-name order.
+    """
+    pages = []
+    for filename in sorted(os.listdir(directory)):
+        if not filename.endswith(".html") or "__" not in filename:
+            continue
+        entity = filename.split("__", 1)[0]
+        with open(os.path.join(directory, filename), 'r', encoding='utf-8') as html_file:
+            pages.append((entity, html_file.read()))
+    return pages
+
+def benchmark(pages, worker_counts, chunksize=1, repeat=3):
+    """
+    Times parsing of the same pages with different worker counts.
+
+    :param pages: A list of (entity, html) tuples.
+    :param worker_counts: The worker counts to try. One worker is always timed
+                          first as the baseline, even if it is not listed.
+    :param chunksize: Number of pages handed to a worker per task.
+    :param repeat: Runs per worker count; the fastest run is kept.
+    :return: A list of (workers, seconds, speedup, efficiency) tuples, with
+             speedup measured against the one-worker time.
+    """
+    rows = []
+    baseline = None
+    for workers in [1] + sorted(set(worker_counts) - {1}):
+        parser = ParallelParser(workers=workers, chunksize=chunksize)
+        best = None
+        for _ in range(repeat):
+            start = time.perf_counter()
+            parser.parse(pages)
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+        if baseline is None:
+            baseline = best
+        speedup = baseline / best
+        rows.append((workers, best, speedup, speedup / workers))
+    return rows
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark parallel parsing of Bloodborne Wiki pages.")
+    parser.add_argument("corpus", help="Directory of saved HTML pages.")
+    parser.add_argument("--save-corpus", action="store_true", help="Fetch the wiki pages into the corpus directory first.")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, os.cpu_count() or 1], help="Worker counts to benchmark.")
+    parser.add_argument("--chunksize", type=int, default=1, help="Pages per worker task.")
+    parser.add_argument("--replicate", type=int, default=20, help="Repeat the corpus this many times to simulate a large crawl.")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per worker count.")
+    args = parser.parse_args()
+
+    if args.save_corpus:
+        save_corpus(BloodborneScraper().fetch_corpus(), args.corpus)
+    pages = load_corpus(args.corpus) * args.replicate
+    if not pages:
+        print(f"No pages found in {args.corpus}")
+        return
+
+    print(f"Parsing {len(pages)} page(s), chunksize {args.chunksize}")
+    print(f"{'workers':>8} {'seconds':>10} {'speedup':>8} {'efficiency':>11}")
+    for workers, seconds, speedup, efficiency in benchmark(pages, args.workers, args.chunksize, args.repeat):
+        print(f"{workers:>8} {seconds:>10.3f} {speedup:>8.2f} {efficiency:>10.0%}")
+
+if __name__ == "__main__":
+    main()
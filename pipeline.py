@@ -0,0 +1,319 @@
+"""
+Bloodborne Wiki Scrape Pipeline
+-------------------------------
+This script defines the ScrapePipeline class, which runs scraping and saving
+as overlapping stages instead of one entity type at a time:
+
+    fetch (threads) -> parse (processes) -> validate -> [assets] -> write (JSON, CSV, SQLite)
+
+Each stage has its own workers and passes items on through a bounded queue, so
+network I/O, CPU-bound parsing and disk writes for different entity types run
+at the same time, and a slow stage makes the stages before it wait
+(backpressure) instead of piling up pages in memory.
+
+Features:
+- Configurable workers, retries and queue sizes per stage.
+- Per-stage failure policy: "fail" stops the pipeline, "skip" drops the item.
+- Per-stage statistics: items, failures, retries, busy/blocked/idle time and
+  utilization, so the stage that limits throughput is easy to spot.
+- Optional SQLite upserts and a snapshot version after the files are written.
+- Optional assets stage that downloads record images before writing (see
+  asset_downloader.py), so the written records include "image-path".
+
+Modules Used:
+- queue, threading: For the bounded queues and stage workers.
+- concurrent.futures: For the parse process pool.
+- time: For stage timing.
+- os: For file paths.
+
+Usage:
+- report = ScrapePipeline(fetch_workers=5, parse_workers=4).run()
+- print(format_report(report))
+
+Author: Austin Bennett
+Date: 2025-07-07
+"""
+
+import os # For output file paths and the default worker count.
+import queue # Bounded queues between stages.
+import threading # Stage worker threads.
+import time # For retry backoff and stage timing.
+from concurrent.futures import ProcessPoolExecutor # Runs parsing in separate processes.
+
+from scraper import BloodborneScraper, ENDPOINTS # Fetching and the entity page list.
+from parallel_parser import _parse_page # Picklable parse entry point for worker processes.
+from data_handler import DataHandler # Writes JSON, CSV, SQLite and snapshots.
+from models import KEY_FIELDS, IMAGE_ENTITIES # Key fields for validation; entity types with images.
+
+_DONE = object() # End-of-stream marker passed between stages
+
+class PipelineError(RuntimeError):
+    """Raised when a stage with the "fail" policy gives up on an item."""
+
+class StageStats:
+    def __init__(self, name, workers):
+        self.name = name
+        self.workers = workers
+        self.items = 0
+        self.failures = 0
+        self.retries = 0
+        self.busy = 0.0 # Seconds spent processing items
+        self.blocked = 0.0 # Seconds waiting for room in the next queue (backpressure)
+        self.idle = 0.0 # Seconds waiting for input
+        self._lock = threading.Lock()
+
+    def add(self, **amounts):
+        with self._lock:
+            for name, amount in amounts.items():
+                setattr(self, name, getattr(self, name) + amount)
+
+    def utilization(self, wall):
+        """
+        The share of the stage's worker time spent processing, between 0 and 1.
+        """
+        return self.busy / (wall * self.workers) if wall > 0 else 0.0
+
+class Stage:
+    def __init__(self, name, func, workers=1, retries=0, on_error="fail", backoff=0.5):
+        """
+        :param name: The stage name used in reports.
+        :param func: Called as func(item); returns the item for the next stage,
+                     or None to pass nothing on.
+        :param workers: Number of worker threads.
+        :param retries: Extra attempts for a failing item.
+        :param on_error: "fail" to stop the pipeline, "skip" to drop the item.
+        :param backoff: Seconds to wait before the first retry (doubles each time).
+        """
+        if on_error not in ("fail", "skip"):
+            raise ValueError("on_error must be 'fail' or 'skip'")
+        self.name = name
+        self.func = func
+        self.workers = max(1, workers)
+        self.retries = retries
+        self.on_error = on_error
+        self.backoff = backoff
+        self.stats = StageStats(name, self.workers)
+
+class ScrapePipeline:
+    def __init__(self, entities=None, fetch_workers=5, parse_workers=None, queue_size=2,
+                 retries=2, on_error="skip", output_dir=".", db_path=None,
+                 snapshot_dir=None, fetch=None, asset_dir=None, asset_workers=8):
+        """
+        :param entities: Entity types to scrape (defaults to all of ENDPOINTS).
+        :param fetch_workers: Concurrent page downloads.
+        :param parse_workers: Parse processes (defaults to the CPU count).
+        :param queue_size: Capacity of each queue between stages.
+        :param retries: Extra attempts per item in the fetch stage.
+        :param on_error: Failure policy for every stage: "fail" or "skip".
+        :param output_dir: Directory for the JSON and CSV files.
+        :param db_path: Optional SQLite database to upsert into as well.
+        :param snapshot_dir: Optional snapshot directory; a version is recorded after writing.
+        :param fetch: Optional fetch function(entity) -> html, e.g. to read a saved corpus.
+        :param asset_dir: Optional asset directory; enables the assets stage.
+        :param asset_workers: Concurrent image downloads in the assets stage.
+        """
+        self.entities = list(entities or ENDPOINTS)
+        self.queue_size = max(1, queue_size)
+        self.output_dir = output_dir
+        self.db_path = db_path
+        self.snapshot_dir = snapshot_dir
+        self.data_handler = DataHandler()
+        self.scraper = BloodborneScraper()
+        self._fetch = fetch or self._fetch_from_wiki
+        self._parse_pool = None
+        self.parse_workers = parse_workers or os.cpu_count() or 1
+        self.results = {} # entity -> validated records that were written
+        self.asset_downloader = None
+        if asset_dir:
+            from asset_downloader import AssetDownloader # Only needed when assets are downloaded
+            self.asset_downloader = AssetDownloader(asset_dir, workers=asset_workers)
+        self.stages = [
+            Stage("fetch", self.fetch_stage, fetch_workers, retries, on_error),
+            Stage("parse", self.parse_stage, self.parse_workers, 0, on_error),
+            Stage("validate", self.validate_stage, 1, 0, on_error),
+            Stage("write", self.write_stage, 1, 1, on_error),
+        ]
+        if self.asset_downloader:
+            # One thread; the downloader runs its own pool of concurrent downloads
+            self.stages.insert(3, Stage("assets", self.asset_stage, 1, 0, on_error))
+        self._abort = threading.Event()
+        self._errors = []
+
+    # Stage functions
+
+    def _fetch_from_wiki(self, entity):
+        html = self.scraper.fetch_html(ENDPOINTS[entity])
+        if html is None:
+            raise IOError(f"Could not fetch {ENDPOINTS[entity]}")
+        return html
+
+    def fetch_stage(self, entity):
+        return entity, self._fetch(entity)
+
+    def parse_stage(self, page):
+        # The thread waits on the process pool, so parse_workers pages are parsed at once
+        return self._parse_pool.submit(_parse_page, page).result()
+
+    def validate_stage(self, parsed):
+        """
+        Drops records without a key and repeated keys; fails if nothing is left.
+        """
+        entity, records = parsed
+        key_field = KEY_FIELDS[entity]
+        seen = set()
+        valid = []
+        for record in records:
+            key = record.get(key_field)
+            if not key or key in seen:
+                continue
+            seen.add(key)
+            valid.append(record)
+        if not valid:
+            raise ValueError(f"No valid {entity} records were extracted")
+        if len(valid) < len(records):
+            print(f"Dropped {len(records) - len(valid)} invalid or duplicate {entity} record(s)")
+        return entity, valid
+
+    def asset_stage(self, validated):
+        entity, records = validated
+        if entity in IMAGE_ENTITIES:
+            self.asset_downloader.attach(entity, records)
+        return entity, records
+
+    def write_stage(self, validated):
+        """
+        Writes the JSON, CSV and (optionally) SQLite output; raises IOError if any
+        write fails, so the stage's retries and failure policy apply.
+        """
+        entity, records = validated
+        json_path = os.path.join(self.output_dir, f"{entity}.json")
+        csv_path = os.path.join(self.output_dir, f"{entity}.csv")
+        if not self.data_handler.save_to_json(json_path, records):
+            raise IOError(f"Could not write {json_path}")
+        if not self.data_handler.save_to_csv(csv_path, records):
+            raise IOError(f"Could not write {csv_path}")
+        if self.db_path and not self.data_handler.save_to_sqlite(self.db_path, entity, records):
+            raise IOError(f"Could not write {entity} to {self.db_path}")
+        # Only written data is reported and included in the snapshot
+        self.results[entity] = records
+        return None
+
+    # Orchestration
+
+    def _process(self, stage, item):
+        """
+        Runs one item through a stage with retries. Returns (ok, output).
+        """
+        delay = stage.backoff
+        for attempt in range(stage.retries + 1):
+            try:
+                return True, stage.func(item)
+            except Exception as e:
+                if attempt < stage.retries:
+                    stage.stats.add(retries=1)
+                    time.sleep(delay)
+                    delay *= 2
+                    continue
+                stage.stats.add(failures=1)
+                label = item[0] if isinstance(item, tuple) else item
+                message = f"{stage.name} failed for {label}: {e}"
+                print(message)
+                self._errors.append(message)
+                if stage.on_error == "fail":
+                    self._abort.set()
+                return False, None
+
+    def _worker(self, stage, in_queue, out_queue, finished, next_workers):
+        stats = stage.stats
+        while True:
+            start = time.perf_counter()
+            item = in_queue.get()
+            stats.add(idle=time.perf_counter() - start)
+            if item is _DONE:
+                break
+            if self._abort.is_set():
+                continue # Drain the queue so upstream stages are never stuck on put()
+            start = time.perf_counter()
+            ok, output = self._process(stage, item)
+            stats.add(busy=time.perf_counter() - start)
+            if ok:
+                stats.add(items=1)
+            if ok and output is not None and out_queue is not None:
+                start = time.perf_counter()
+                out_queue.put(output)
+                stats.add(blocked=time.perf_counter() - start)
+        # The last worker of a stage to finish tells every downstream worker to stop
+        with finished["lock"]:
+            finished["count"] += 1
+            last = finished["count"] == stage.workers
+        if last and out_queue is not None:
+            for _ in range(next_workers):
+                out_queue.put(_DONE)
+
+    def run(self):
+        """
+        Runs every stage to completion.
+
+        :return: A report dictionary with wall time, per-stage statistics and errors.
+        :raises PipelineError: if a stage with the "fail" policy gave up.
+        """
+        queues = [queue.Queue(maxsize=self.queue_size) for _ in self.stages]
+        queues.append(None) # The last (write) stage has no output queue
+        threads = []
+        start = time.perf_counter()
+        with ProcessPoolExecutor(max_workers=self.parse_workers) as pool:
+            self._parse_pool = pool
+            for i, stage in enumerate(self.stages):
+                finished = {"count": 0, "lock": threading.Lock()}
+                next_workers = self.stages[i + 1].workers if i + 1 < len(self.stages) else 0
+                for n in range(stage.workers):
+                    thread = threading.Thread(
+                        target=self._worker, name=f"{stage.name}-{n}",
+                        args=(stage, queues[i], queues[i + 1], finished, next_workers), daemon=True,
+                    )
+                    thread.start()
+                    threads.append(thread)
+
+            # Feed the fetch stage; put() blocks while the fetch queue is full
+            for entity in self.entities:
+                queues[0].put(entity)
+            for _ in range(self.stages[0].workers):
+                queues[0].put(_DONE)
+            for thread in threads:
+                thread.join()
+        self._parse_pool = None
+        wall = time.perf_counter() - start
+
+        if self.snapshot_dir and self.results and not self._abort.is_set():
+            self.data_handler.save_snapshot(self.snapshot_dir, self.results, note="scrape")
+
+        report = {
+            "wall": wall,
+            "stages": [stage.stats for stage in self.stages],
+            "errors": list(self._errors),
+            "written": {entity: len(records) for entity, records in self.results.items()},
+        }
+        if self._abort.is_set():
+            raise PipelineError("; ".join(self._errors))
+        return report
+
+def format_report(report):
+    """
+    Formats a pipeline report as a table of per-stage statistics.
+    """
+    wall = report["wall"]
+    lines = [
+        f"Pipeline finished in {wall:.2f}s; written: {report['written']}",
+        f"{'stage':<10}{'workers':>8}{'items':>7}{'failed':>7}{'retries':>8}"
+        f"{'busy s':>8}{'blocked s':>10}{'idle s':>8}{'util':>7}",
+    ]
+    busiest = max(report["stages"], key=lambda s: s.utilization(wall))
+    for stats in report["stages"]:
+        marker = "  <- limiting stage" if stats is busiest else ""
+        lines.append(
+            f"{stats.name:<10}{stats.workers:>8}{stats.items:>7}{stats.failures:>7}{stats.retries:>8}"
+            f"{stats.busy:>8.2f}{stats.blocked:>10.2f}{stats.idle:>8.2f}{stats.utilization(wall):>7.0%}{marker}"
+        )
+    for error in report["errors"]:
+        lines.append(f"error: {error}")
+    return "\n".join(lines)
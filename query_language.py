@@ -0,0 +1,447 @@
+"""
+Bloodborne Wiki Query Language
+------------------------------
+This script defines a small query language for filtering Bloodborne entities,
+for example:
+
+    boss where HP > 3000 and location ~ "Yharnam" order by blood-echoes desc limit 5
+
+Queries are parsed once into predicate closures and cached by query text.
+Each run is planned against the current data: the planner uses the most
+selective index it can (a sorted numeric column or a categorical value index)
+and falls back to a full scan only when no index applies. A run reads the
+records once and builds or reuses indexes for exactly those records, so a
+reload during the run cannot mix row ids from two versions of the data.
+Queries on a SQLite EntityTable are compiled to SQL instead (see
+EntityTable.run_query), so they always read the live database.
+
+Syntax:
+- <entity> [where <condition>] [order by <field> [asc|desc]] [limit <n>]
+- Entities: weapon(s), armor, boss(es), item(s)/consumable(s), npc(s).
+- Conditions: <field> <op> <value>, combined with and, or, not and parentheses.
+- Operators: = != > >= < <= and ~ (case-insensitive "contains").
+- Values: numbers, "quoted strings" or single words. Field names are
+  case-insensitive; use `backticks` for names with spaces (`special attack`).
+
+Modules Used:
+- re: For tokenizing queries.
+- bisect: For range lookups in sorted columns.
+- functools: For the LRU cache of compiled queries.
+- threading: Guards the indexes against a file-watcher thread.
+
+Usage:
+- engine = QueryEngine(dataset, group_engine)
+- entity, results = engine.run('npc where timezones ~ "blood moon" limit 3')
+
+Author: Austin Bennett
+Date: 2025-06-20
+"""
+
+import re # For tokenizing query strings.
+import threading # Serializes index updates with reloads from a watcher thread.
+from bisect import bisect_left, bisect_right # For range lookups in sorted columns.
+from functools import lru_cache # Caches compiled queries by their text.
+
+from models import ENTITY_FIELDS, NUMERIC_FIELDS, CATEGORICAL_FIELDS, MULTI_VALUED_FIELDS, parse_number # Entity metadata.
+
+ENTITY_ALIASES = {
+    "weapon": "weapons", "weapons": "weapons",
+    "armor": "armor", "armors": "armor",
+    "boss": "bosses", "bosses": "bosses",
+    "item": "items", "items": "items", "consumable": "items", "consumables": "items",
+    "npc": "npcs", "npcs": "npcs",
+}
+
+KEYWORDS = {"where", "and", "or", "not", "order", "by", "asc", "desc", "limit"}
+COMPARISONS = {"=", "!=", ">", ">=", "<", "<=", "~"}
+
+TOKEN_RE = re.compile(r"""
+    \s*(?:
+        (?P<number>-?\d+(?:\.\d+)?(?![\w-]))
+      | (?P<string>"(?:[^"\\]|\\.)*"|'(?:[^'\\]|\\.)*')
+      | (?P<field>`[^`]+`)
+      | (?P<op>>=|<=|!=|=|>|<|~|\(|\))
+      | (?P<word>[^\s=!<>~()"'`]+)
+    )""", re.VERBOSE)
+
+class QueryError(ValueError):
+    """Raised for queries that cannot be parsed or refer to unknown fields."""
+
+def tokenize(text):
+    """
+    Splits a query into (kind, value) tokens.
+    """
+    tokens = []
+    pos = 0
+    text = text.rstrip()
+    while pos < len(text):
+        match = TOKEN_RE.match(text, pos)
+        if not match or match.end() == pos:
+            raise QueryError(f"Unexpected character at position {pos}: {text[pos:pos + 10]!r}")
+        pos = match.end()
+        kind = match.lastgroup
+        value = match.group(kind)
+        if kind == "number":
+            value = parse_number(value)
+        elif kind == "string":
+            value = re.sub(r"\\(.)", r"\1", value[1:-1])
+        elif kind == "field":
+            value = value[1:-1]
+        elif kind == "word" and value.lower() in KEYWORDS:
+            kind, value = "keyword", value.lower()
+        tokens.append((kind, value))
+    return tokens
+
+class CompiledQuery:
+    """
+    A parsed query: the entity type, a predicate over records, the top-level
+    conjuncts the planner can match against indexes, and the order/limit clauses.
+    """
+    def __init__(self, text, entity, condition, order_field, descending, limit):
+        self.text = text
+        self.entity = entity
+        self.condition = condition
+        self.predicate = _compile(condition) if condition else (lambda record: True)
+        self.conjuncts = _conjuncts(condition)
+        self.order_field = order_field
+        self.descending = descending
+        self.limit = limit
+
+class _Parser:
+    def __init__(self, text):
+        self.text = text
+        self.tokens = tokenize(text)
+        self.pos = 0
+
+    def peek(self):
+        return self.tokens[self.pos] if self.pos < len(self.tokens) else (None, None)
+
+    def take(self):
+        token = self.peek()
+        self.pos += 1
+        return token
+
+    def accept(self, kind, value=None):
+        tok_kind, tok_value = self.peek()
+        if tok_kind == kind and (value is None or tok_value == value):
+            self.pos += 1
+            return True
+        return False
+
+    def expect(self, kind, value=None):
+        if not self.accept(kind, value):
+            found = self.peek()[1]
+            raise QueryError(f"Expected {value or kind} but found {found if found is not None else 'end of query'!r}")
+
+    def parse(self):
+        kind, word = self.take()
+        self.entity = ENTITY_ALIASES.get(str(word).lower()) if kind == "word" else None
+        if not self.entity:
+            raise QueryError(f"Unknown entity {word!r}; expected one of: weapon, armor, boss, item, npc")
+        condition = None
+        order_field, descending, limit = None, False, None
+        if self.accept("keyword", "where"):
+            condition = self.parse_or()
+        if self.accept("keyword", "order"):
+            self.expect("keyword", "by")
+            order_field = self.parse_field()
+            if self.accept("keyword", "desc"):
+                descending = True
+            else:
+                self.accept("keyword", "asc")
+        if self.accept("keyword", "limit"):
+            kind, value = self.take()
+            if kind != "number" or not isinstance(value, int) or value < 0:
+                raise QueryError("limit must be a non-negative whole number")
+            limit = value
+        if self.pos < len(self.tokens):
+            raise QueryError(f"Unexpected {self.peek()[1]!r} at end of query")
+        return CompiledQuery(self.text, self.entity, condition, order_field, descending, limit)
+
+    def parse_or(self):
+        terms = [self.parse_and()]
+        while self.accept("keyword", "or"):
+            terms.append(self.parse_and())
+        return terms[0] if len(terms) == 1 else ("or", terms)
+
+    def parse_and(self):
+        factors = [self.parse_not()]
+        while self.accept("keyword", "and"):
+            factors.append(self.parse_not())
+        return factors[0] if len(factors) == 1 else ("and", factors)
+
+    def parse_not(self):
+        if self.accept("keyword", "not"):
+            return ("not", self.parse_not())
+        if self.accept("op", "("):
+            condition = self.parse_or()
+            self.expect("op", ")")
+            return condition
+        field = self.parse_field()
+        kind, op = self.take()
+        if kind != "op" or op not in COMPARISONS:
+            raise QueryError(f"Expected a comparison after {field!r}")
+        kind, value = self.take()
+        if kind not in ("number", "string", "word"):
+            raise QueryError(f"Expected a value after {field} {op}")
+        if op in (">", ">=", "<", "<=") and not isinstance(value, (int, float)):
+            raise QueryError(f"{field} {op} needs a number")
+        return ("cmp", field, op, value)
+
+    def parse_field(self):
+        kind, name = self.take()
+        if kind not in ("word", "field"):
+            raise QueryError(f"Expected a field name but found {name!r}")
+        for field in ENTITY_FIELDS[self.entity]:
+            if field.lower() == str(name).lower():
+                return field
+        raise QueryError(f"Unknown field {name!r} for {self.entity}; fields: {', '.join(ENTITY_FIELDS[self.entity])}")
+
+def _compile(node):
+    """
+    Turns a condition tree into a predicate closure over record dictionaries.
+    """
+    kind = node[0]
+    if kind == "and":
+        parts = [_compile(child) for child in node[1]]
+        return lambda record: all(part(record) for part in parts)
+    if kind == "or":
+        parts = [_compile(child) for child in node[1]]
+        return lambda record: any(part(record) for part in parts)
+    if kind == "not":
+        inner = _compile(node[1])
+        return lambda record: not inner(record)
+
+    _, field, op, value = node
+    if op == "~":
+        needle = str(value).lower()
+        return lambda record: needle in str(record.get(field) or "").lower()
+    if isinstance(value, (int, float)):
+        compare = {
+            "=": lambda a: a == value, "!=": lambda a: a != value,
+            ">": lambda a: a > value, ">=": lambda a: a >= value,
+            "<": lambda a: a < value, "<=": lambda a: a <= value,
+        }[op]
+        if op == "!=":
+            return lambda record: compare(parse_number(record.get(field)))
+        def numeric(record):
+            number = parse_number(record.get(field))
+            return number is not None and compare(number)
+        return numeric
+    text = str(value).lower()
+    if op == "=":
+        return lambda record: str(record.get(field) or "").lower() == text
+    return lambda record: str(record.get(field) or "").lower() != text
+
+def _conjuncts(node):
+    """
+    Returns the comparisons that every matching record must satisfy, i.e. the
+    top-level AND terms. These are the candidates for an index lookup.
+    """
+    if node is None:
+        return []
+    if node[0] == "cmp":
+        return [node]
+    if node[0] == "and":
+        return [child for child in node[1] if child[0] == "cmp"]
+    return []
+
+@lru_cache(maxsize=128)
+def compile_query(text):
+    """
+    Parses a query string into a CompiledQuery. Results are cached, so repeated
+    query strings skip tokenizing, parsing and closure building.
+    """
+    return _Parser(text.strip()).parse()
+
+class QueryEngine:
+    def __init__(self, dataset, group_engine=None):
+        """
+        :param dataset: The Dataset to query. Indexes are built lazily and dropped
+                        when their entity type is reloaded.
+        :param group_engine: Optional GroupByEngine whose categorical columns are
+                             reused for equality indexes.
+        """
+        self.dataset = dataset
+        self.group_engine = group_engine
+        # Every cache maps to (source, value), where source is the records object the
+        # value was built from; an entry is only used for that same object.
+        self._sorted = {} # (entity, field) -> (source, (sorted numbers, row ids in the same order, row ids largest first))
+        self._equality = {} # (entity, field) -> (source, {lowercased value: [row ids]})
+        self._lock = threading.RLock()
+        dataset.subscribe(self.invalidate)
+
+    def invalidate(self, entity, records=None):
+        with self._lock:
+            self._sorted = {k: v for k, v in self._sorted.items() if k[0] != entity}
+            self._equality = {k: v for k, v in self._equality.items() if k[0] != entity}
+
+    def records(self, entity):
+        """
+        Returns the current records of an entity type as a list. A SQLite
+        EntityTable is read afresh every time, since the database can change
+        without a dataset reload.
+        """
+        source = self.dataset.get(entity)
+        return source if isinstance(source, list) else list(source)
+
+    def sorted_column(self, entity, field, records=None):
+        """
+        Returns (numbers, rows, rows_descending) for a numeric field, sorted by
+        number; equal numbers keep table order in both directions. Rows whose
+        value is not a number are left out.
+
+        :param records: The list of records to index (defaults to the current records).
+        """
+        records = self.records(entity) if records is None else records
+        key = (entity, field)
+        with self._lock:
+            cached = self._sorted.get(key)
+            if cached is not None and cached[0] is records:
+                return cached[1]
+            pairs = sorted(
+                (number, row) for row, record in enumerate(records)
+                if (number := parse_number(record.get(field))) is not None
+            )
+            descending = sorted(pairs, key=lambda p: (-p[0], p[1]))
+            column = ([p[0] for p in pairs], [p[1] for p in pairs], [p[1] for p in descending])
+            self._sorted[key] = (records, column)
+            return column
+
+    def equality_index(self, entity, field, records=None):
+        """
+        Returns {lowercased value: [rows]} for a single-valued categorical field.
+
+        :param records: The list of records to index (defaults to the current records).
+        """
+        records = self.records(entity) if records is None else records
+        key = (entity, field)
+        with self._lock:
+            cached = self._equality.get(key)
+            if cached is not None and cached[0] is records:
+                return cached[1]
+            index = {}
+            if self.group_engine:
+                column = self.group_engine.column(entity, field, records)
+                for row, code in enumerate(column.codes):
+                    index.setdefault(str(column.categories[code]).lower(), []).append(row)
+            else:
+                for row, record in enumerate(records):
+                    index.setdefault(str(record.get(field) or "").lower(), []).append(row)
+            self._equality[key] = (records, index)
+            return index
+
+    def _index_candidates(self, entity, comparison, records):
+        """
+        Returns the rows an index says may match a comparison, or None if no
+        index applies to it.
+        """
+        _, field, op, value = comparison
+        if field in NUMERIC_FIELDS[entity] and isinstance(value, (int, float)) and op != "!=":
+            numbers, rows, _ = self.sorted_column(entity, field, records)
+            lo, hi = {
+                "=": (bisect_left(numbers, value), bisect_right(numbers, value)),
+                ">": (bisect_right(numbers, value), len(numbers)),
+                ">=": (bisect_left(numbers, value), len(numbers)),
+                "<": (0, bisect_left(numbers, value)),
+                "<=": (0, bisect_right(numbers, value)),
+            }[op]
+            return rows[lo:hi]
+        if (op == "=" and field in CATEGORICAL_FIELDS[entity]
+                and field not in MULTI_VALUED_FIELDS.get(entity, [])):
+            return self.equality_index(entity, field, records).get(str(value).lower(), [])
+        return None
+
+    def plan(self, query, records=None):
+        """
+        Chooses how to find the candidate rows of a query.
+
+        :param records: The list of records the query runs on (defaults to the current records).
+        :return: (description, rows) where rows is a list of row ids into records
+                 in table order, or None to scan the whole table.
+        """
+        records = self.records(query.entity) if records is None else records
+        best = None
+        for comparison in query.conjuncts:
+            rows = self._index_candidates(query.entity, comparison, records)
+            if rows is not None and (best is None or len(rows) < len(best[1])):
+                best = (comparison, rows)
+        if best is None:
+            return "full scan", None
+        _, field, op, value = best[0]
+        return f"index on {field} {op} {value!r} ({len(best[1])} candidate rows)", sorted(best[1])
+
+    def explain(self, text):
+        """
+        Describes the plan that would be used for a query.
+        """
+        query = compile_query(text)
+        source = self.dataset.get(query.entity)
+        if hasattr(source, "explain_query"): # SQLite EntityTable
+            return source.explain_query(query)
+        description, _ = self.plan(query)
+        if (description == "full scan" and query.order_field and query.limit is not None
+                and query.order_field in NUMERIC_FIELDS[query.entity]):
+            description = f"sorted column {query.order_field} until {query.limit} matches"
+        return description
+
+    def run(self, text):
+        """
+        Runs a query against the current data.
+
+        :return: (entity, results) where results is a list of record dictionaries.
+        """
+        query = compile_query(text)
+        entity = query.entity
+        source = self.dataset.get(entity)
+        if hasattr(source, "run_query"):
+            # A SQLite EntityTable runs the query in SQL, using its indexes
+            results, exact = source.run_query(query)
+            if not exact:
+                results = [record for record in results if query.predicate(record)]
+                if query.order_field:
+                    results = _order(results, entity, query.order_field, query.descending)
+                if query.limit is not None:
+                    results = results[:query.limit]
+            return entity, results
+
+        records = self.records(entity) # Read once; every index below is for this list
+        _, rows = self.plan(query, records)
+
+        # With no selective index, "order by <numeric> limit n" can walk the
+        # sorted column and stop as soon as n rows match.
+        if (rows is None and query.order_field and query.limit is not None
+                and query.order_field in NUMERIC_FIELDS[entity]):
+            _, ascending, descending = self.sorted_column(entity, query.order_field, records)
+            ordered = descending if query.descending else ascending
+            results = []
+            for row in ordered:
+                if len(results) >= query.limit:
+                    break
+                if query.predicate(records[row]):
+                    results.append(records[row])
+            if len(results) < query.limit:
+                # Rows without a number sort last, like in _order()
+                seen = set(ordered)
+                results += [r for i, r in enumerate(records) if i not in seen and query.predicate(r)]
+            return entity, results[:query.limit]
+
+        candidates = records if rows is None else (records[row] for row in rows)
+        results = [record for record in candidates if query.predicate(record)]
+        if query.order_field:
+            results = _order(results, entity, query.order_field, query.descending)
+        if query.limit is not None:
+            results = results[:query.limit]
+        return entity, results
+
+def _order(results, entity, field, descending):
+    """
+    Sorts results by a field: numerically for numeric fields (non-numbers last),
+    otherwise case-insensitively.
+    """
+    if field in NUMERIC_FIELDS[entity]:
+        present = [r for r in results if parse_number(r.get(field)) is not None]
+        missing = [r for r in results if parse_number(r.get(field)) is None]
+        present.sort(key=lambda r: parse_number(r.get(field)), reverse=descending)
+        return present + missing
+    return sorted(results, key=lambda r: str(r.get(field) or "").lower(), reverse=descending)
@@ -0,0 +1,97 @@
+"""
+Bloodborne Wiki Result Cache
+----------------------------
+This script defines the ResultCache class, a memoizing layer for CLI commands.
+Results are keyed by the command name, its normalized arguments and the
+versions of the entity types it reads, so a cached result is reused until the
+underlying data is reloaded.
+
+Features:
+- Least-recently-used eviction with a configurable size.
+- Argument normalization (surrounding whitespace is ignored; inner whitespace
+  is kept, since it is significant inside query literals and filter values).
+- Keys include per-entity dataset versions, so reloading one entity type
+  only stops reuse of results that read it.
+- Hit/miss counters for checking how effective the cache is.
+- Not used for SQLite EntityTables: the database can change without the
+  dataset versions moving, so those commands always query it directly.
+
+Modules Used:
+- collections: OrderedDict for LRU ordering.
+- threading: For safe use alongside a file-watcher thread.
+
+Usage:
+- cache = ResultCache(dataset)
+- cache.get_or_compute("bosses_with_min_hp", (5000,), ["bosses"], compute)
+
+Author: Austin Bennett
+Date: 2025-06-24
+"""
+
+import threading # Guards the cache against concurrent access.
+from collections import OrderedDict # Keeps entries in least-recently-used order.
+
+def normalize_args(args):
+    """
+    Normalizes command arguments for use in a cache key. Strings have surrounding
+    whitespace removed; lists become tuples.
+    """
+    normalized = []
+    for arg in args:
+        if isinstance(arg, str):
+            arg = arg.strip()
+        elif isinstance(arg, list):
+            arg = tuple(normalize_args(arg))
+        normalized.append(arg)
+    return tuple(normalized)
+
+class ResultCache:
+    def __init__(self, dataset, maxsize=64):
+        """
+        :param dataset: The Dataset whose per-entity versions are part of each key.
+        :param maxsize: The number of results kept before the least recently used is evicted.
+        """
+        self.dataset = dataset
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def key(self, command, args, entities, versions=None):
+        versions = self.dataset.versions if versions is None else versions
+        return (command, normalize_args(args), tuple(versions[entity] for entity in entities))
+
+    def get_or_compute(self, command, args, entities, compute, versions=None):
+        """
+        Returns the cached result for a command, computing and storing it on a miss.
+
+        :param command: The command name (e.g. "advanced_filter").
+        :param args: The command's arguments as a tuple.
+        :param entities: The entity types the command reads.
+        :param compute: A function taking no arguments that produces the result.
+        :param versions: The per-entity versions of the data compute() reads, taken
+                         together with that data (see Dataset.state()). Defaults to
+                         the current versions, read before compute() runs.
+        """
+        key = self.key(command, args, entities, versions)
+        with self._lock:
+            if key in self._entries:
+                self.hits += 1
+                self._entries.move_to_end(key)
+                return self._entries[key]
+            self.misses += 1
+        result = compute()
+        with self._lock:
+            self._entries[key] = result
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return result
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
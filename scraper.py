@@ -9,7 +9,13 @@ Features:
 - Fetches HTML content from the Bloodborne Wiki.
 - Extracts and structures data for various Bloodborne entities.
 - Implements exception handling for request failures.
+- Fetches over one requests.Session with a timeout, so connections are reused
+  and a stalled request fails instead of hanging.
 - Uses BeautifulSoup for HTML parsing.
+- Keeps fetching and extraction separate, so raw HTML can be parsed in worker
+  processes (see parallel_parser.py).
+- Records the image/icon URL of weapons, consumables and NPCs, so the assets
+  can be downloaded separately (see asset_downloader.py).
 
 Modules Used:
 - requests: For making HTTP requests to the Bloodborne Wiki.
@@ -22,239 +28,362 @@ Date: 2025-03-13
 import requests # A Python library for making HTTP requests to fetch web content.
 from bs4 import BeautifulSoup # Part of the bs4 library, used for parsing HTML and extracting data from web pages.
 
+# Wiki page for each entity type, relative to the base URL.
+ENDPOINTS = {
+    "weapons": "p/weapons.html",
+    "armor": "p/armor-sets.html",
+    "bosses": "p/bosses.html",
+    "items": "p/consumables.html",
+    "npcs": "p/npcs.html",
+}
+
+def image_url(cell):
+    """
+    Returns the image URL in a table cell (src, or data-src for lazy-loaded
+    images), or None if the cell has no image.
+    """
+    img = cell.find("img")
+    if not img:
+        return None
+    return img.get("src") or img.get("data-src")
+
+def extract_weapons(soup):
+    """
+    Extracts weapon data from a parsed weapons page.
+
+    :param soup: BeautifulSoup object of the weapons page.
+    :return: A list of dictionaries containing weapon data.
+    """
+    weapons = [] # Initialize an empty list to store weapon data
+    expected_headers = ['image', 'name', 'damage', 'qs bullet use', 'durability', 'stats needed\nstat bonuses', 'special attack', 'availability', 'special note']
+    tables = soup.find_all("table", {"class": "wiki-blog-table-sheader"}) # Find all tables with the class "wiki-blog-table-sheader"
+    for table in tables:
+        header_row = table.find("tr") # Find the first row in the table
+        if not header_row:
+            continue
+        headers = [th.text.strip().lower() for th in header_row.find_all("th")] # Find all header cells in the row
+        # Check if the headers match the expected headers
+        if headers[:len(expected_headers)] == expected_headers:
+            rows = table.find_all("tr") # Find all rows in the table
+            for row in rows[1:]:  # Skip header
+                cols = row.find_all("td") # Find all columns in the row
+                if len(cols) < 5: # Ensure there are enough columns
+                    continue
+                name_link = cols[1].find("a") # Find the first anchor tag in the second column
+                # Parse damage column: e.g. '25 / - / - / - / -\n\n(Physical)'
+                damage_text = cols[2].text.strip()
+                base_damage = damage_type = ""
+                if "\n\n" in damage_text:
+                    base, dtype = damage_text.split("\n\n", 1)
+                    base_damage = base.split("/")[0].strip()
+                    damage_type = dtype.replace("(", "").replace(")", "").strip()
+                else:
+                    base_damage = damage_text.split("/")[0].strip()
+                    damage_type = ""
+                # Parse stats needed and stat bonuses
+                stats_text = cols[5].text.strip()
+                if "\n\n" in stats_text:
+                    stats_needed, stat_bonuses = stats_text.split("\n\n", 1)
+                    stats_needed = stats_needed.strip()
+                    stat_bonuses = stat_bonuses.strip()
+                else:
+                    stats_needed = stats_text
+                    stat_bonuses = ""
+                weapon = {
+                    "name": cols[1].text.strip(),
+                    "link": name_link["href"] if name_link and name_link.has_attr("href") else None,
+                    "base-damage": base_damage,
+                    "damage-type": damage_type,
+                    "durability": cols[4].text.strip(),
+                    "stats-needed": stats_needed,
+                    "stat-bonuses": stat_bonuses,
+                    "special attack": cols[6].text.strip(),
+                    "image": image_url(cols[0]),
+                }
+                weapons.append(weapon)
+            break  # Stop after finding the correct table
+    return weapons
+
+def extract_armor(soup):
+    """
+    Extracts armor data from a parsed armor sets page.
+
+    :param soup: BeautifulSoup object of the armor sets page.
+    :return: A list of dictionaries containing armor data.
+    """
+    armor = [] # Initialize an empty list to store armor data
+    expected_titles = ['Set', 'Physical', 'VS blunt', 'VS Thurst', 'Blood', 'Arcane', 'Fire', 'Bolt', 'Slow Poison RES', 'Rapid Poison RES', 'Frenzy RES', 'Beasthood']
+    tables = soup.find_all("table", {"class": "wiki-blog-table-sheader"})
+    for table in tables:
+        header_row = table.find("tr")
+        if not header_row:
+            continue
+        # Extract title from <img class="image"> if present, otherwise use text
+        header_titles = []
+        for th in header_row.find_all("th"):
+            img = th.find("img", class_="image")
+            if img and img.has_attr("title"):
+                header_titles.append(img["title"].strip())
+            else:
+                header_titles.append(th.text.strip())
+        # Check if all expected titles are in header_titles (in order)
+        if all(title in header_titles for title in expected_titles):
+            rows = table.find_all("tr")
+            for row in rows[1:]:  # Skip the header row
+                cols = row.find_all("td")
+                if len(cols) < 12:
+                    continue
+                set_link = cols[0].find("a")
+                armor_set = {
+                    "set": cols[0].text.strip(),
+                    "link": set_link["href"] if set_link and set_link.has_attr("href") else None,
+                    "physical-defense": cols[1].text.strip(),
+                    "blunt-defense": cols[2].text.strip(),
+                    "thrust-defense": cols[3].text.strip(),
+                    "blood-defense": cols[4].text.strip(),
+                    "arcane-defense": cols[5].text.strip(),
+                    "fire-defense": cols[6].text.strip(),
+                    "bolt-defense": cols[7].text.strip(),
+                    "slow-poison-resist": cols[8].text.strip(),
+                    "rapid-poison-resist": cols[9].text.strip(),
+                    "frenzy-resist": cols[10].text.strip(),
+                    "beasthood": cols[11].text.strip(),
+                }
+                armor.append(armor_set)
+    return armor
+
+def extract_bosses(soup):
+    """
+    Extracts boss data from a parsed bosses page.
+
+    :param soup: BeautifulSoup object of the bosses page.
+    :return: A list of dictionaries containing boss data.
+    """
+    bosses = [] # Initialize an empty list to store boss data
+    expected_headers = ['boss', 'drops', 'hp', 'blood echoes', 'location', 'interruptible', 'required']
+    tables = soup.find_all("table", {"class": "wiki-blog-table-sheader1"}) # Find all tables with the class "wiki-blog-table-sheader1"
+    for table in tables:
+        header_row = table.find("tr") # Find the first row in the table
+        if not header_row:
+            continue
+        headers = [th.text.strip().lower() for th in header_row.find_all("th")] # Find all header cells in the row
+        # Check if the headers match the expected headers
+        if headers[:len(expected_headers)] == expected_headers:
+            rows = table.find_all("tr") # Find all rows in the table
+            for row in rows[1:]:  # Skip header
+                cols = row.find_all("td") # Find all columns in the row
+                if len(cols) < 6: # Ensure there are enough columns
+                    continue
+                # Find the <a> tag inside a <strong> tag in the first column
+                strong_tag = cols[0].find("strong")
+                name_link = strong_tag.find("a") if strong_tag else None
+                boss = {
+                    "name": cols[0].text.strip(),
+                    "link": name_link["href"] if name_link and name_link.has_attr("href") else None, # Extract the link if it exists
+                    "drops": cols[1].text.strip(),
+                    "HP": cols[2].text.strip(),
+                    "blood-echoes": cols[3].text.strip(),
+                    "location": cols[4].text.strip(),
+                    "required": cols[6].text.strip(),
+                }
+                bosses.append(boss)
+    return bosses
+
+def extract_consumables(soup):
+    """
+    Extracts item data from a parsed consumables page.
+
+    :param soup: BeautifulSoup object of the consumables page.
+    :return: A list of dictionaries containing item data.
+    """
+    consumables = []
+    # Define the expected headers (lowercase for comparison)
+    expected_headers = ['icon', 'name', 'effect', 'no. held', 'stored', 'usage type', 'availability']
+    tables = soup.find_all("table", {"class": "wiki-blog-table-sheader1"})
+    for table in tables:
+        header_row = table.find("tr")
+        if not header_row:
+            continue
+        headers = [th.text.strip().lower() for th in header_row.find_all("th")]
+        if headers[:len(expected_headers)] == expected_headers:
+            rows = table.find_all("tr")
+            for row in rows[1:]:  # Skip the header row
+                cols = row.find_all("td")
+                if len(cols) < 6:
+                    continue
+                name_link = cols[1].find("a")
+                item = {
+                    "name": cols[1].text.strip(),
+                    "link": name_link["href"] if name_link and name_link.has_attr("href") else None,
+                    "effect": cols[2].text.strip(),
+                    "num-held": cols[3].text.strip(),
+                    "stored": cols[4].text.strip(),
+                    "usage-type": cols[5].text.strip(),
+                    "image": image_url(cols[0]),
+                }
+                consumables.append(item)
+    return consumables
+
+def extract_npcs(soup):
+    """
+    Extracts NPC data from a parsed NPCs page.
+
+    :param soup: BeautifulSoup object of the NPCs page.
+    :return: A list of dictionaries containing NPC data.
+    """
+    npcs = []
+    # Define the expected headers (lowercase for comparison)
+    expected_headers = ['image', 'name', 'item', 'drop', 'location', 'timezones']
+    tables = soup.find_all("table", {"class": "wiki-blog-table-sheader1"})
+    for table in tables:
+        header_row = table.find("tr")
+        if not header_row:
+            continue
+        headers = [th.text.strip().lower() for th in header_row.find_all("th")]
+        if headers[:len(expected_headers)] == expected_headers:
+            rows = table.find_all("tr")
+            for row in rows[1:]:  # Skip the header row
+                cols = row.find_all("td")
+                if len(cols) < 4:
+                    continue
+                name_link = cols[1].find("a")
+                npc = {
+                    "name": cols[1].text.strip(),
+                    "link": name_link["href"] if name_link and name_link.has_attr("href") else None,
+                    "item": cols[2].text.strip(),
+                    "drop": cols[3].text.strip(),
+                    "location": cols[4].text.strip(),
+                    "timezones": cols[5].text.strip(),  # E.g., Day, Evening, Night, Blood Moon
+                    "image": image_url(cols[0]),
+                }
+                npcs.append(npc)
+    return npcs
+
+# Extraction function for each entity type, keyed like ENDPOINTS.
+EXTRACTORS = {
+    "weapons": extract_weapons,
+    "armor": extract_armor,
+    "bosses": extract_bosses,
+    "items": extract_consumables,
+    "npcs": extract_npcs,
+}
+
+def parse_html(entity, html):
+    """
+    Parses raw HTML for an entity page and extracts its records.
+    Defined at module level so it can be sent to worker processes.
+
+    :param entity: The entity type (a key of EXTRACTORS, e.g. "weapons").
+    :param html: The raw HTML text of the page.
+    :return: A list of dictionaries containing the extracted records.
+    """
+    soup = BeautifulSoup(html, 'html.parser')
+    return EXTRACTORS[entity](soup)
+
 # Custom module for scraping data from the Bloodborne Wiki.
 class BloodborneScraper:
-    def __init__(self): # Initialize the scraper with the base URL of the Bloodborne Wiki.
+    def __init__(self, timeout=30, session=None): # Initialize the scraper with the base URL of the Bloodborne Wiki.
+        """
+        :param timeout: Seconds before a request is abandoned, so a stalled fetch
+                        fails (and can be retried) instead of hanging.
+        :param session: Optional requests.Session to use instead of a new one.
+        """
         self.base_url = "https://www.bloodborne-wiki.com/"
+        self.timeout = timeout
+        self.session = session or requests.Session() # Reuses connections to the wiki across pages
 
-    def fetch_page(self, endpoint):
+    def fetch_html(self, endpoint):
         """
-        Fetches the HTML content of a given endpoint from the Bloodborne Wiki.
-        
-        :param endpoint: The specific page to fetch (e.g., "Weapons", "Bosses").
-        :return: BeautifulSoup object containing the parsed HTML content.
+        Fetches the raw HTML text of a given endpoint from the Bloodborne Wiki.
+
+        :param endpoint: The specific page to fetch (e.g., "p/weapons.html").
+        :return: The HTML text of the page, or None if the request failed or timed out.
         """
         try:
-            response = requests.get(self.base_url + endpoint) # Make a GET request to the specified URL
+            response = self.session.get(self.base_url + endpoint, timeout=self.timeout) # Make a GET request to the specified URL
             response.raise_for_status()  # Raise an HTTPError for bad responses
             print(f"Fetching: {self.base_url + endpoint}") # Print the URL being fetched
-            return BeautifulSoup(response.text, 'html.parser') # Parse the HTML content with BeautifulSoup
+            return response.text
         except requests.RequestException as e:
             print(f"Failed to fetch page {endpoint}: {e}")
-            print(f"Response Status Code: {response.status_code}")
+            if e.response is not None:
+                print(f"Response Status Code: {e.response.status_code}")
             return None
 
+    def fetch_page(self, endpoint):
+        """
+        Fetches the HTML content of a given endpoint from the Bloodborne Wiki.
+
+        :param endpoint: The specific page to fetch (e.g., "Weapons", "Bosses").
+        :return: BeautifulSoup object containing the parsed HTML content.
+        """
+        html = self.fetch_html(endpoint)
+        if html is None:
+            return None
+        return BeautifulSoup(html, 'html.parser') # Parse the HTML content with BeautifulSoup
+
+    def fetch_corpus(self, entities=None):
+        """
+        Fetches the raw HTML for several entity pages without parsing them.
+
+        :param entities: Entity types to fetch (defaults to all of ENDPOINTS).
+        :return: A list of (entity, html) tuples for the pages that were fetched.
+        """
+        pages = []
+        for entity in entities or ENDPOINTS:
+            html = self.fetch_html(ENDPOINTS[entity])
+            if html is not None:
+                pages.append((entity, html))
+        return pages
+
+    def scrape(self, entity):
+        """
+        Fetches and extracts the records for a single entity type.
+
+        :param entity: The entity type (a key of ENDPOINTS, e.g. "bosses").
+        :return: A list of dictionaries containing the entity's data.
+        """
+        soup = self.fetch_page(ENDPOINTS[entity])
+        if not soup:
+            return []
+        return EXTRACTORS[entity](soup)
+
     def scrape_weapons(self):
         """
         Scrapes weapon data from the Bloodborne Wiki.
-        
+
         :return: A list of dictionaries containing weapon data.
         """
-        weapons = [] # Initialize an empty list to store weapon data
-        soup = self.fetch_page("p/weapons.html") # Fetch the weapons page
-        if soup:
-            expected_headers = ['image', 'name', 'damage', 'qs bullet use', 'durability', 'stats needed\nstat bonuses', 'special attack', 'availability', 'special note']
-        tables = soup.find_all("table", {"class": "wiki-blog-table-sheader"}) # Find all tables with the class "wiki-blog-table-sheader"
-        for table in tables: 
-            header_row = table.find("tr") # Find the first row in the table
-            if not header_row:
-                continue
-            headers = [th.text.strip().lower() for th in header_row.find_all("th")] # Find all header cells in the row
-            # Check if the headers match the expected headers
-            if headers[:len(expected_headers)] == expected_headers:
-                rows = table.find_all("tr") # Find all rows in the table
-                for row in rows[1:]:  # Skip header
-                    cols = row.find_all("td") # Find all columns in the row
-                    if len(cols) < 5: # Ensure there are enough columns
-                        continue
-                    name_link = cols[1].find("a") # Find the first anchor tag in the second column
-                                 # Parse damage column: e.g. '25 / - / - / - / -\n\n(Physical)'
-                    damage_text = cols[2].text.strip()
-                    base_damage = damage_type = ""
-                    if "\n\n" in damage_text:
-                        base, dtype = damage_text.split("\n\n", 1)
-                        base_damage = base.split("/")[0].strip()
-                        damage_type = dtype.replace("(", "").replace(")", "").strip()
-                    else:
-                        base_damage = damage_text.split("/")[0].strip()
-                        damage_type = ""
-                    # Parse stats needed and stat bonuses
-                    stats_text = cols[5].text.strip()
-                    if "\n\n" in stats_text:
-                        stats_needed, stat_bonuses = stats_text.split("\n\n", 1)
-                        stats_needed = stats_needed.strip()
-                        stat_bonuses = stat_bonuses.strip()
-                    else:
-                        stats_needed = stats_text
-                        stat_bonuses = ""
-                    weapon = {
-                        "name": cols[1].text.strip(),
-                        "link": name_link["href"] if name_link and name_link.has_attr("href") else None,
-                        "base-damage": base_damage,
-                        "damage-type": damage_type,
-                        "durability": cols[4].text.strip(),
-                        "stats-needed": stats_needed,
-                        "stat-bonuses": stat_bonuses,
-                        "special attack": cols[6].text.strip(),
-                    }
-                    weapons.append(weapon)
-                break  # Stop after finding the correct table
-        return weapons
-
+        return self.scrape("weapons")
 
     def scrape_armor(self):
         """
         Scrapes armor data from the Bloodborne Wiki.
-        
+
         :return: A list of dictionaries containing armor data.
         """
-        armor = [] # Initialize an empty list to store armor data
-        soup = self.fetch_page("p/armor-sets.html") # Fetch the armor page
-        if soup:
-            expected_titles = ['Set', 'Physical', 'VS blunt', 'VS Thurst', 'Blood', 'Arcane', 'Fire', 'Bolt', 'Slow Poison RES', 'Rapid Poison RES', 'Frenzy RES', 'Beasthood']
-        tables = soup.find_all("table", {"class": "wiki-blog-table-sheader"})
-        for table in tables:
-            header_row = table.find("tr")
-            if not header_row:
-                continue
-            # Extract title from <img class="image"> if present, otherwise use text
-            header_titles = []
-            for th in header_row.find_all("th"):
-                img = th.find("img", class_="image")
-                if img and img.has_attr("title"):
-                    header_titles.append(img["title"].strip())
-                else:
-                    header_titles.append(th.text.strip())
-            # Check if all expected titles are in header_titles (in order)
-            if all(title in header_titles for title in expected_titles):
-                rows = table.find_all("tr")
-                for row in rows[1:]:  # Skip the header row
-                    cols = row.find_all("td")
-                    if len(cols) < 12:
-                        continue
-                    set_link = cols[0].find("a")
-                    armor_set = {
-                        "set": cols[0].text.strip(),
-                        "link": set_link["href"] if set_link and set_link.has_attr("href") else None,
-                        "physical-defense": cols[1].text.strip(),
-                        "blunt-defense": cols[2].text.strip(),
-                        "thrust-defense": cols[3].text.strip(),
-                        "blood-defense": cols[4].text.strip(),
-                        "arcane-defense": cols[5].text.strip(),
-                        "fire-defense": cols[6].text.strip(),
-                        "bolt-defense": cols[7].text.strip(),
-                        "slow-poison-resist": cols[8].text.strip(),
-                        "rapid-poison-resist": cols[9].text.strip(),
-                        "frenzy-resist": cols[10].text.strip(),
-                        "beasthood": cols[11].text.strip(),
-                    }
-                    armor.append(armor_set)
-        return armor
+        return self.scrape("armor")
 
     def scrape_bosses(self):
         """
         Scrapes boss data from the Bloodborne Wiki.
-        
+
         :return: A list of dictionaries containing boss data.
         """
-        bosses = [] # Initialize an empty list to store weapon data
-        soup = self.fetch_page("p/bosses.html") # Fetch the weapons page
-        if soup:
-            expected_headers = ['boss', 'drops', 'hp', 'blood echoes', 'location', 'interruptible', 'required']
-        tables = soup.find_all("table", {"class": "wiki-blog-table-sheader1"}) # Find all tables with the class "wiki-blog-table-sheader"
-        for table in tables: 
-            header_row = table.find("tr") # Find the first row in the table
-            if not header_row:
-                continue
-            headers = [th.text.strip().lower() for th in header_row.find_all("th")] # Find all header cells in the row
-            # Check if the headers match the expected headers
-            if headers[:len(expected_headers)] == expected_headers:
-                rows = table.find_all("tr") # Find all rows in the table
-                for row in rows[1:]:  # Skip header
-                    cols = row.find_all("td") # Find all columns in the row
-                    if len(cols) < 6: # Ensure there are enough columns
-                        continue
-                    # Find the <a> tag inside a <strong> tag in the first column
-                    strong_tag = cols[0].find("strong") 
-                    name_link = strong_tag.find("a") if strong_tag else None 
-                    boss = {
-                        "name": cols[0].text.strip(),
-                        "link": name_link["href"] if name_link and name_link.has_attr("href") else None, # Extract the link if it exists
-                        "drops": cols[1].text.strip(),
-                        "HP": cols[2].text.strip(),
-                        "blood-echoes": cols[3].text.strip(),
-                        "location": cols[4].text.strip(),
-                        "required": cols[6].text.strip(),
-                    }
-                    bosses.append(boss)
-        return bosses
-    
+        return self.scrape("bosses")
+
     def scrape_consumables(self):
         """
         Scrapes item data from the Bloodborne Wiki.
 
         :return: A list of dictionaries containing item data.
         """
-        consumables = []
-        soup = self.fetch_page("p/consumables.html")
-        if soup:
-        # Define the expected headers (lowercase for comparison)
-            expected_headers = ['icon', 'name', 'effect', 'no. held', 'stored', 'usage type', 'availability']
-        tables = soup.find_all("table", {"class": "wiki-blog-table-sheader1"})
-        for table in tables:
-            header_row = table.find("tr")
-            if not header_row:
-                continue
-            headers = [th.text.strip().lower() for th in header_row.find_all("th")]
-            if headers[:len(expected_headers)] == expected_headers:
-                rows = table.find_all("tr")
-                for row in rows[1:]:  # Skip the header row
-                    cols = row.find_all("td")
-                    if len(cols) < 6:
-                        continue
-                    name_link = cols[1].find("a")
-                    item = {
-                        "name": cols[1].text.strip(),
-                        "link": name_link["href"] if name_link and name_link.has_attr("href") else None,
-                        "effect": cols[2].text.strip(),
-                        "num-held": cols[3].text.strip(),
-                        "stored": cols[4].text.strip(),
-                        "usage-type": cols[5].text.strip()
-                    }
-                    consumables.append(item)
-        return consumables
+        return self.scrape("items")
 
     def scrape_npcs(self):
         """
         Scrapes NPC data from the Bloodborne Wiki.
-        
+
         :return: A list of dictionaries containing NPC data.
         """
-        npcs = []
-        soup = self.fetch_page("p/npcs.html")
-        if soup:
-             # Define the expected headers (lowercase for comparison)
-            expected_headers = ['image', 'name', 'item', 'drop', 'location', 'timezones']
-            tables = soup.find_all("table", {"class": "wiki-blog-table-sheader1"})
-        for table in tables:
-            header_row = table.find("tr")
-            if not header_row:
-                continue
-            headers = [th.text.strip().lower() for th in header_row.find_all("th")]
-            if headers[:len(expected_headers)] == expected_headers:
-                rows = table.find_all("tr")
-                for row in rows[1:]:  # Skip the header row
-                    cols = row.find_all("td")
-                    if len(cols) < 4:
-                        continue
-                    name_link = cols[1].find("a")
-                    npc = {
-                        "name": cols[1].text.strip(),
-                        "link": name_link["href"] if name_link and name_link.has_attr("href") else None,
-                        "item": cols[2].text.strip(),
-                        "drop": cols[3].text.strip(),
-                        "location": cols[4].text.strip(),
-                        "timezones": cols[5].text.strip()  # E.g., Day, Evening, Night, Blood Moon
-                    }
-                    npcs.append(npc)
-        return npcs
\ No newline at end of file
+        return self.scrape("npcs")
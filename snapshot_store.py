@@ -0,0 +1,262 @@
+"""
+Bloodborne Wiki Snapshot Store
+------------------------------
+This script defines the SnapshotStore class, which keeps the history of the
+scraped data as numbered versions instead of overwriting it on every scrape.
+
+Features:
+- Each commit stores only record-level changes against the previous version:
+  added records, removed keys and the changed fields of changed records.
+- A full checkpoint is written every N versions, so rebuilding any version
+  reads one checkpoint plus at most N - 1 deltas.
+- Rebuilds any past version ("as of"), for all entity types or just one.
+- Diffs any two versions record by record.
+
+Storage layout (inside the snapshot directory):
+- manifest.json: the list of versions with their kind, time and record counts.
+- v00001.json, v00002.json, ...: one checkpoint or delta file per version.
+
+Modules Used:
+- json: For the manifest and version files.
+- os: For file paths.
+- datetime: For version timestamps.
+
+Usage:
+- store = SnapshotStore("snapshots")
+- version = store.commit({"bosses": bosses, "npcs": npcs})
+- store.load(version - 1, "bosses"); store.diff(1, version)
+
+Author: Austin Bennett
+Date: 2025-06-30
+"""
+
+import json # A module for working with JSON data, allowing you to save and load structured data.
+import os # Provides functions for interacting with the operating system, such as file handling.
+from datetime import datetime # For recording when each version was created.
+
+from models import KEY_FIELDS # The field that identifies a record in each entity type.
+
+def keyed_records(entity, records):
+    """
+    Returns a dictionary of records keyed by their key field, in record order.
+    Repeated keys get an occurrence suffix ("Name#2") so no record is lost.
+    """
+    key_field = KEY_FIELDS.get(entity, "name")
+    keyed = {}
+    for record in records:
+        key = str(record.get(key_field))
+        if key in keyed:
+            n = 2
+            while f"{key}#{n}" in keyed:
+                n += 1
+            key = f"{key}#{n}"
+        keyed[key] = record
+    return keyed
+
+def record_delta(previous, current):
+    """
+    Computes the delta that turns one version of an entity's records into the next.
+
+    :param previous: The keyed records of the previous version.
+    :param current: The keyed records of the new version.
+    :return: A delta dictionary, or None if nothing changed.
+    """
+    added = {key: record for key, record in current.items() if key not in previous}
+    removed = [key for key in previous if key not in current]
+    changed = {}
+    for key, record in current.items():
+        old = previous.get(key)
+        if old is None or old == record:
+            continue
+        fields = {field: value for field, value in record.items() if old.get(field, object()) != value}
+        dropped = [field for field in old if field not in record]
+        changed[key] = {"set": fields, "unset": dropped} if dropped else {"set": fields}
+    # Keep order changes only when they differ from "old order minus removed, plus added"
+    expected = [key for key in previous if key in current] + list(added)
+    order = list(current) if expected != list(current) else None
+
+    if not (added or removed or changed or order):
+        return None
+    delta = {"added": added, "removed": removed, "changed": changed}
+    if order:
+        delta["order"] = order
+    return delta
+
+def apply_delta(keyed, delta):
+    """
+    Applies a delta from record_delta() to keyed records and returns the result.
+    The input is not modified.
+    """
+    removed = set(delta.get("removed", []))
+    result = {}
+    for key, record in keyed.items():
+        if key in removed:
+            continue
+        change = delta.get("changed", {}).get(key)
+        if change:
+            record = dict(record)
+            record.update(change.get("set", {}))
+            for field in change.get("unset", []):
+                record.pop(field, None)
+        result[key] = record
+    result.update(delta.get("added", {}))
+    if "order" in delta:
+        result = {key: result[key] for key in delta["order"]}
+    return result
+
+class SnapshotStore:
+    def __init__(self, directory="snapshots", checkpoint_interval=10, read_only=False):
+        """
+        :param directory: The directory holding the manifest and version files.
+        :param checkpoint_interval: Write a full checkpoint every this many versions.
+        :param read_only: If True, only read existing versions; the directory is
+                          not created and commit() raises IOError.
+        """
+        self.directory = directory
+        self.checkpoint_interval = max(1, checkpoint_interval)
+        self.read_only = read_only
+        self._cache = {} # version -> {entity: keyed records}, for the most recent rebuilds
+        if not read_only:
+            os.makedirs(directory, exist_ok=True)
+        self.manifest = self._read_json("manifest.json") or {"versions": []}
+
+    def _path(self, name):
+        return os.path.join(self.directory, name)
+
+    def _read_json(self, name):
+        path = self._path(name)
+        if not os.path.exists(path):
+            return None
+        with open(path, 'r', encoding='utf-8') as json_file:
+            return json.load(json_file)
+
+    def _write_json(self, name, data):
+        # Write then rename, so a crash never leaves a half-written version
+        path = self._path(name)
+        with open(path + ".tmp", 'w', encoding='utf-8') as json_file:
+            json.dump(data, json_file, ensure_ascii=False)
+        os.replace(path + ".tmp", path)
+
+    def versions(self):
+        """
+        Returns the manifest entries of every version, oldest first.
+        """
+        return list(self.manifest["versions"])
+
+    def latest_version(self):
+        """
+        Returns the newest version number, or 0 if nothing has been committed.
+        """
+        versions = self.manifest["versions"]
+        return versions[-1]["version"] if versions else 0
+
+    def _entry(self, version):
+        for entry in self.manifest["versions"]:
+            if entry["version"] == version:
+                return entry
+        raise KeyError(f"Unknown snapshot version {version}")
+
+    def _state(self, version):
+        """
+        Rebuilds the keyed records of every entity type at a version.
+        """
+        if version in self._cache:
+            return self._cache[version]
+        self._entry(version) # Validate
+        # Walk back to the nearest checkpoint, then replay deltas forward
+        entries = [e for e in self.manifest["versions"] if e["version"] <= version]
+        start = max(i for i, e in enumerate(entries) if e["kind"] == "checkpoint")
+        state = {}
+        for entry in entries[start:]:
+            data = self._read_json(f"v{entry['version']:05d}.json")
+            if entry["kind"] == "checkpoint":
+                state = {entity: keyed_records(entity, records) for entity, records in data.items()}
+            else:
+                state = dict(state)
+                for entity, delta in data.items():
+                    state[entity] = apply_delta(state.get(entity, {}), delta)
+        self._cache[version] = state
+        while len(self._cache) > 4:
+            self._cache.pop(next(iter(self._cache)))
+        return state
+
+    def commit(self, datasets, note=""):
+        """
+        Stores the given data as a new version. Entity types not included keep
+        their records from the previous version.
+
+        :param datasets: A dictionary mapping entity types to lists of records.
+        :param note: An optional description stored in the manifest.
+        :return: The new version number, or the latest one if nothing changed.
+        :raises IOError: if the store was opened read-only.
+        """
+        if self.read_only:
+            raise IOError(f"Snapshot store {self.directory} is open read-only")
+        latest = self.latest_version()
+        previous = self._state(latest) if latest else {}
+        current = dict(previous)
+        for entity, records in datasets.items():
+            # Copy the records so later edits by the caller cannot alter stored history
+            current[entity] = keyed_records(entity, [dict(record) for record in records or []])
+
+        version = latest + 1
+        checkpoint = latest == 0 or (version - 1) % self.checkpoint_interval == 0
+        if checkpoint:
+            if latest and all(record_delta(previous.get(e, {}), current[e]) is None for e in current):
+                return latest
+            data = {entity: list(keyed.values()) for entity, keyed in current.items()}
+        else:
+            data = {}
+            for entity, keyed in current.items():
+                delta = record_delta(previous.get(entity, {}), keyed)
+                if delta:
+                    data[entity] = delta
+            if not data:
+                return latest
+
+        self._write_json(f"v{version:05d}.json", data)
+        self.manifest["versions"].append({
+            "version": version,
+            "kind": "checkpoint" if checkpoint else "delta",
+            "created": datetime.now().isoformat(timespec="seconds"),
+            "note": note,
+            "counts": {entity: len(keyed) for entity, keyed in current.items()},
+        })
+        self._write_json("manifest.json", self.manifest)
+        self._cache[version] = current
+        return version
+
+    def load(self, version, entity=None):
+        """
+        Rebuilds the data as of a version.
+
+        :param version: The version number.
+        :param entity: If given, return only that entity type's records.
+        :return: A list of records, or a dictionary of entity type -> records.
+        """
+        state = self._state(version)
+        if entity is not None:
+            return list(state.get(entity, {}).values())
+        return {name: list(keyed.values()) for name, keyed in state.items()}
+
+    def diff(self, old_version, new_version, entity=None):
+        """
+        Compares two versions record by record.
+
+        :return: A dictionary mapping each entity type with changes to
+                 {"added": [records], "removed": [records], "changed": [(old, new)]}.
+        """
+        old_state = self._state(old_version)
+        new_state = self._state(new_version)
+        entities = [entity] if entity else sorted(set(old_state) | set(new_state))
+        result = {}
+        for name in entities:
+            old, new = old_state.get(name, {}), new_state.get(name, {})
+            changes = {
+                "added": [record for key, record in new.items() if key not in old],
+                "removed": [record for key, record in old.items() if key not in new],
+                "changed": [(old[key], record) for key, record in new.items() if key in old and old[key] != record],
+            }
+            if any(changes.values()):
+                result[name] = changes
+        return result
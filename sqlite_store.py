@@ -0,0 +1,371 @@
+"""
+Bloodborne Wiki SQLite Store
+----------------------------
+This script defines the SQLiteStore class, an optional storage backend that keeps
+Bloodborne Wiki data in a single SQLite database instead of flat JSON/CSV files.
+
+Features:
+- One table per entity type, with the original string fields plus typed
+  numeric columns (e.g. hp_num) for fields such as HP and defenses.
+- B-tree indexes on name, link and every numeric column.
+- An FTS5 table per entity for full-text search (skipped if SQLite lacks FTS5).
+- Bulk import from the existing JSON/CSV files and bulk upserts of scraped records.
+- EntityTable views that let the CLI push paging, filters and statistics down to SQL,
+  including compiled query-language queries (conditions, order and limit).
+
+Modules Used:
+- sqlite3: For the database itself.
+- os: For locating the JSON/CSV files to import.
+
+Usage:
+- store = SQLiteStore("bloodborne.db"); store.import_files()
+- store.upsert("bosses", scraper.scrape_bosses())
+- store.table("bosses").where_greater("HP", 5000)
+
+Author: Austin Bennett
+Date: 2025-06-05
+"""
+
+import os # Provides functions for interacting with the operating system, such as file handling.
+import sqlite3 # Built-in SQLite database driver.
+
+from data_handler import DataHandler # Loads the JSON/CSV files for bulk import.
+from models import ENTITY_FIELDS, KEY_FIELDS, NUMERIC_FIELDS, parse_number # Entity metadata.
+
+def column_name(field):
+    """
+    Converts a record field such as "blood-echoes" or "special attack" to a SQL column name.
+    """
+    return field.lower().replace("-", "_").replace(" ", "_")
+
+class SQLiteStore:
+    def __init__(self, filename="bloodborne.db"):
+        """
+        Opens (and if needed creates) the database.
+
+        :param filename: Path of the SQLite database file.
+        """
+        self.filename = filename
+        self.conn = sqlite3.connect(filename)
+        self.conn.row_factory = sqlite3.Row
+        self.fts_enabled = self._has_fts5()
+        self.create_schema()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def close(self):
+        self.conn.close()
+
+    def _has_fts5(self):
+        try:
+            self.conn.execute("CREATE VIRTUAL TABLE temp.fts5_probe USING fts5(x)")
+            self.conn.execute("DROP TABLE temp.fts5_probe")
+            return True
+        except sqlite3.OperationalError:
+            return False
+
+    def create_schema(self):
+        """
+        Creates the entity tables, indexes and full-text tables if they do not exist.
+        """
+        with self.conn:
+            for entity, fields in ENTITY_FIELDS.items():
+                key = column_name(KEY_FIELDS[entity])
+                columns = ["id INTEGER PRIMARY KEY"]
+                for field in fields:
+                    col = column_name(field)
+                    columns.append(f'"{col}" TEXT' + (" NOT NULL UNIQUE" if col == key else ""))
+                for field in NUMERIC_FIELDS[entity]:
+                    columns.append(f'"{column_name(field)}_num" NUMERIC')
+                self.conn.execute(f'CREATE TABLE IF NOT EXISTS {entity} ({", ".join(columns)})')
+                # Databases created before a field was added get the missing columns
+                existing = {row[1] for row in self.conn.execute(f"PRAGMA table_info({entity})")}
+                for column in columns[1:]:
+                    if column.split('"')[1] not in existing:
+                        self.conn.execute(f"ALTER TABLE {entity} ADD COLUMN {column}")
+
+                # The key column already has a unique index; add the link and numeric columns.
+                indexed = ["link"] + [column_name(f) + "_num" for f in NUMERIC_FIELDS[entity]]
+                for col in indexed:
+                    self.conn.execute(f'CREATE INDEX IF NOT EXISTS idx_{entity}_{col} ON {entity} ("{col}")')
+
+                if self.fts_enabled:
+                    text_cols = ", ".join(f'"{column_name(f)}"' for f in fields if f not in ("link", "image", "image-path"))
+                    self.conn.execute(
+                        f"CREATE VIRTUAL TABLE IF NOT EXISTS {entity}_fts USING fts5({text_cols}, "
+                        f"content='{entity}', content_rowid='id')"
+                    )
+
+    def _rebuild_fts(self, entity):
+        if self.fts_enabled:
+            self.conn.execute(f"INSERT INTO {entity}_fts({entity}_fts) VALUES ('rebuild')")
+
+    def upsert(self, entity, records):
+        """
+        Inserts or updates records in bulk, matching on the entity's key field.
+
+        :param entity: The entity type (e.g. "bosses").
+        :param records: A list of record dictionaries.
+        :return: The number of records written.
+        """
+        fields = ENTITY_FIELDS[entity]
+        numeric = NUMERIC_FIELDS[entity]
+        key = column_name(KEY_FIELDS[entity])
+        cols = [column_name(f) for f in fields] + [column_name(f) + "_num" for f in numeric]
+        col_list = ", ".join(f'"{c}"' for c in cols)
+        updates = ", ".join(f'"{c}" = excluded."{c}"' for c in cols if c != key)
+        sql = (
+            f"INSERT INTO {entity} ({col_list}) VALUES ({', '.join('?' * len(cols))}) "
+            f'ON CONFLICT("{key}") DO UPDATE SET {updates}'
+        )
+        rows = [
+            [record.get(f) for f in fields] + [parse_number(record.get(f)) for f in numeric]
+            for record in records
+        ]
+        with self.conn:
+            self.conn.executemany(sql, rows)
+            self._rebuild_fts(entity)
+        return len(rows)
+
+    def import_files(self, directory="."):
+        """
+        Bulk imports all entity types from <entity>.json, falling back to <entity>.csv.
+
+        :param directory: The directory containing the data files.
+        :return: A dictionary mapping each entity type to the number of records imported.
+        """
+        data_handler = DataHandler()
+        counts = {}
+        for entity in ENTITY_FIELDS:
+            json_path = os.path.join(directory, f"{entity}.json")
+            csv_path = os.path.join(directory, f"{entity}.csv")
+            if os.path.exists(json_path):
+                records = data_handler.load_from_json(json_path)
+            elif os.path.exists(csv_path):
+                records = data_handler.load_from_csv(csv_path)
+            else:
+                continue
+            counts[entity] = self.upsert(entity, records or [])
+        return counts
+
+    def table(self, entity):
+        """
+        Returns an EntityTable view over one entity type.
+        """
+        return EntityTable(self, entity)
+
+    def row_to_record(self, entity, row):
+        return {field: row[column_name(field)] for field in ENTITY_FIELDS[entity]}
+
+    def select_sql(self, entity, where="", params=(), order="id", limit=None, offset=0):
+        """
+        Builds a SELECT on one entity table. Returns (sql, params).
+        """
+        sql = f"SELECT * FROM {entity}"
+        if where:
+            sql += f" WHERE {where}"
+        sql += f" ORDER BY {order}"
+        if limit is not None:
+            sql += " LIMIT ? OFFSET ?"
+            params = tuple(params) + (limit, offset)
+        return sql, params
+
+    def query(self, entity, where="", params=(), order="id", limit=None, offset=0):
+        """
+        Runs a SELECT on one entity table and returns record dictionaries.
+        """
+        sql, params = self.select_sql(entity, where, params, order, limit, offset)
+        return [self.row_to_record(entity, row) for row in self.conn.execute(sql, params)]
+
+    def load(self, entity):
+        """
+        Loads every record of an entity type in insertion order.
+        """
+        return self.query(entity)
+
+    def search(self, entity, text, limit=50):
+        """
+        Full-text search over an entity's text fields, best matches first.
+        Falls back to a LIKE scan on the key field if FTS5 is unavailable.
+
+        :param limit: The most results to return, or None for all of them.
+        """
+        if not self.fts_enabled:
+            return self.table(entity).filter_contains(KEY_FIELDS[entity], text)[:limit]
+        # Quote each term so punctuation in names (commas, apostrophes) is not FTS syntax
+        match = " ".join('"' + term.replace('"', '""') + '"' for term in text.split())
+        if not match:
+            return []
+        rows = self.conn.execute(
+            f"SELECT {entity}.* FROM {entity}_fts JOIN {entity} ON {entity}.id = {entity}_fts.rowid "
+            f"WHERE {entity}_fts MATCH ? ORDER BY rank LIMIT ?",
+            (match, -1 if limit is None else limit), # A negative LIMIT means no limit
+        )
+        return [self.row_to_record(entity, row) for row in rows]
+
+class EntityTable:
+    """
+    A list-like, read-only view of one entity table. Supports len(), indexing
+    and slicing (via LIMIT/OFFSET), so the CLI can page through it like a list,
+    plus query helpers that run in SQL instead of Python scans.
+    """
+    def __init__(self, store, entity):
+        self.store = store
+        self.entity = entity
+
+    def __len__(self):
+        return self.store.conn.execute(f"SELECT COUNT(*) FROM {self.entity}").fetchone()[0]
+
+    def __bool__(self):
+        return len(self) > 0
+
+    def __iter__(self):
+        return iter(self.store.load(self.entity))
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            rows = self.store.query(self.entity, limit=max(0, stop - start), offset=start)
+            return rows[::step] if step != 1 else rows
+        length = len(self)
+        if index < 0:
+            index += length
+        if not 0 <= index < length:
+            raise IndexError("EntityTable index out of range")
+        return self.store.query(self.entity, limit=1, offset=index)[0]
+
+    def fields(self):
+        return list(ENTITY_FIELDS[self.entity])
+
+    def _numeric_column(self, field):
+        if field not in NUMERIC_FIELDS[self.entity]:
+            raise ValueError(f"{field} is not a numeric field of {self.entity}")
+        return f'"{column_name(field)}_num"'
+
+    def filter_contains(self, field, value):
+        """
+        Case-insensitive substring match on a field (SQL LIKE).
+        """
+        if field not in ENTITY_FIELDS[self.entity]:
+            return []
+        escaped = value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+        return self.store.query(self.entity, f'"{column_name(field)}" LIKE ? ESCAPE \'\\\'', (f"%{escaped}%",))
+
+    def search(self, text, limit=None):
+        """
+        Full-text search over the table's text fields (FTS5), best matches first.
+        """
+        return self.store.search(self.entity, text, limit)
+
+    def where_greater(self, field, value):
+        """
+        Records whose numeric field is greater than value (uses the field's index).
+        """
+        return self.store.query(self.entity, f"{self._numeric_column(field)} > ?", (value,))
+
+    def max_by(self, field):
+        """
+        The record with the largest value in a numeric field, or None if empty.
+        """
+        rows = self.store.query(self.entity, f"{self._numeric_column(field)} IS NOT NULL",
+                                order=f"{self._numeric_column(field)} DESC", limit=1)
+        return rows[0] if rows else None
+
+    # Query-language support: a CompiledQuery's condition tree is translated to SQL.
+
+    def _sql_comparison(self, node):
+        """
+        Translates one ("cmp", field, op, value) node to (sql, params), or None if
+        it has no SQL equivalent. Every expression is 0 or 1, never NULL, so NOT
+        behaves like the Python predicate. Text comparisons ignore the case of
+        ASCII letters, like the LIKE filters.
+        """
+        _, field, op, value = node
+        col = f'"{column_name(field)}"'
+        text = f"LOWER(COALESCE({col}, ''))"
+        if op == "~":
+            escaped = str(value).lower().replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+            return f"{text} LIKE ? ESCAPE '\\'", (f"%{escaped}%",)
+        if isinstance(value, (int, float)):
+            if field not in NUMERIC_FIELDS[self.entity]:
+                return None
+            num = self._numeric_column(field)
+            if op == "!=":
+                return f"({num} IS NULL OR {num} != ?)", (value,)
+            return f"({num} IS NOT NULL AND {num} {op} ?)", (value,)
+        return f"{text} {op} ?", (str(value).lower(),)
+
+    def _sql_condition(self, node):
+        """
+        Translates a condition tree to (sql, params), or None if any part has no
+        SQL equivalent.
+        """
+        kind = node[0]
+        if kind == "cmp":
+            return self._sql_comparison(node)
+        if kind == "not":
+            inner = self._sql_condition(node[1])
+            return None if inner is None else (f"NOT {inner[0]}", inner[1])
+        parts = [self._sql_condition(child) for child in node[1]]
+        if any(part is None for part in parts):
+            return None
+        joiner = " AND " if kind == "and" else " OR "
+        return "(" + joiner.join(sql for sql, _ in parts) + ")", tuple(p for _, params in parts for p in params)
+
+    def _compile_query(self, query):
+        """
+        Returns (sql, params, exact) for a CompiledQuery. If exact, the SELECT
+        applies the whole condition, order and limit; otherwise it only applies
+        the top-level AND terms that translate, and the caller must filter,
+        order and limit the rows itself.
+        """
+        condition = self._sql_condition(query.condition) if query.condition else ("", ())
+        if condition is not None:
+            where, params = condition
+            order = "id"
+            if query.order_field:
+                direction = "DESC" if query.descending else "ASC"
+                if query.order_field in NUMERIC_FIELDS[self.entity]:
+                    num = self._numeric_column(query.order_field)
+                    order = f"{num} IS NULL, {num} {direction}, id" # Non-numbers last, like _order()
+                else:
+                    order = f"LOWER(COALESCE(\"{column_name(query.order_field)}\", '')) {direction}, id"
+            sql, params = self.store.select_sql(self.entity, where, params, order, query.limit)
+            return sql, params, True
+        parts = [part for part in map(self._sql_comparison, query.conjuncts) if part is not None]
+        where = " AND ".join(sql for sql, _ in parts)
+        sql, params = self.store.select_sql(self.entity, where, tuple(p for _, ps in parts for p in ps))
+        return sql, params, False
+
+    def run_query(self, query):
+        """
+        Runs a CompiledQuery (see query_language.py) in SQL.
+
+        :return: (records, exact); if exact is False the records are only
+                 prefiltered and still need the query's predicate, order and limit.
+        """
+        sql, params, exact = self._compile_query(query)
+        rows = self.store.conn.execute(sql, params)
+        return [self.store.row_to_record(self.entity, row) for row in rows], exact
+
+    def explain_query(self, query):
+        """
+        Describes how SQLite runs a CompiledQuery (EXPLAIN QUERY PLAN).
+        """
+        sql, params, exact = self._compile_query(query)
+        steps = [row[-1] for row in self.store.conn.execute("EXPLAIN QUERY PLAN " + sql, params)]
+        return "SQLite: " + "; ".join(steps) + ("" if exact else " (then filtered in Python)")
+
+    def value_counts(self, field):
+        """
+        (value, count) pairs for a field, most common first.
+        """
+        col = f'"{column_name(field)}"'
+        rows = self.store.conn.execute(
+            f"SELECT {col}, COUNT(*) AS n FROM {self.entity} GROUP BY {col} ORDER BY n DESC, MIN(id)"
+        )
+        return [(row[0], row[1]) for row in rows]